@@ -0,0 +1,46 @@
+"""Smoke test for the rules save flow (run with `python -m unittest`).
+
+Builds a rule the same way _save_rules does — including a LoadBottom, whose
+constructor kwargs have regressed once before — and round-trips it through
+the repository.
+"""
+import importlib.util
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+
+def _load_rule_manager():
+    path = Path(__file__).resolve().parent.parent / "tools" / "rule_manager.py"
+    spec = importlib.util.spec_from_file_location("rule_manager", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+rm = _load_rule_manager()
+
+
+class SaveRulesTest(unittest.TestCase):
+    def test_save_round_trip_with_load_bottom(self):
+        rule = rm.ModRule()
+        rule.LoadBottom = rm.LoadBottomRule(Value=True, Comment=["keep last"])
+        rule.LoadAfter = {"brrainz.harmony": rm.ModDependencyRule(Name=["Harmony"], Comment=[])}
+
+        with tempfile.TemporaryDirectory() as tmp:
+            repo = rm.ModRulesRepository(Path(tmp) / "rules.json")
+            with mock.patch.object(rm.messagebox, "showinfo"):
+                repo.save_rules({"some.mod": rule})
+            reloaded = repo.get_all_rules()
+
+        self.assertIn("some.mod", reloaded)
+        loaded = reloaded["some.mod"]
+        self.assertIsNotNone(loaded.LoadBottom)
+        self.assertTrue(loaded.LoadBottom.Value)
+        self.assertEqual(loaded.LoadBottom.Comment, ["keep last"])
+        self.assertIn("brrainz.harmony", loaded.LoadAfter)
+
+
+if __name__ == "__main__":
+    unittest.main()
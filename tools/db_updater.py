@@ -1,15 +1,23 @@
 import os
 import json
-import xml.etree.ElementTree as ET
+try:
+    import orjson  # Rust-backed JSON; several times faster on the multi-MB DB
+except ImportError:
+    orjson = None
+try:
+    import lxml.etree as ET  # C-based parser, much faster on thousands of About.xml files
+except ImportError:
+    import xml.etree.ElementTree as ET
 from pathlib import Path
 import sys
 import asyncio
+import functools
 import aiohttp
-import re
 from typing import List, Dict, Any, Optional, Tuple
 
 import threading
 import queue
+from concurrent.futures import ProcessPoolExecutor
 
 import tkinter as tk
 from tkinter import ttk, filedialog, scrolledtext
@@ -17,11 +25,14 @@ from tkinter import ttk, filedialog, scrolledtext
 # --- Configuration (Constants) ---
 API_URL = "https://api.steampowered.com/ISteamRemoteStorage/GetPublishedFileDetails/v1/"
 MAX_CONCURRENT_REQUESTS = 10
-VERSION_REGEX = re.compile(r"^\d+\.\d+(\.\d+)?$")
+RETRY_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 1.0
+API_BATCH_SIZE = 100  # GetPublishedFileDetails accepts many ids per POST
 DB_JSON_FILE = Path(__file__).resolve().parent.parent / "db" / "db.json"
 BATCH_SIZE = 10
 
 # --- New Helper Function for Version Comparison ---
+@functools.lru_cache(maxsize=4096)
 def get_version_key(version_str: str) -> Tuple[int, ...]:
     """Converts a version string '1.5.2' into a tuple (1, 5, 2) for correct comparison."""
     try:
@@ -30,6 +41,26 @@ def get_version_key(version_str: str) -> Tuple[int, ...]:
         # Return a low value for un-parseable strings so they are never considered 'highest'
         return (0,)
 
+class _NotifyingQueue:
+    """SimpleQueue wrapper that pings the GUI whenever a message lands.
+
+    Lets the app drain messages on demand via after_idle instead of polling
+    the queue on a timer.
+    """
+    def __init__(self, notify):
+        self._queue = queue.SimpleQueue()
+        self._notify = notify
+
+    def put(self, item):
+        self._queue.put(item)
+        try:
+            self._notify()
+        except RuntimeError:
+            pass  # main loop already torn down
+
+    def get_nowait(self):
+        return self._queue.get_nowait()
+
 class ModUpdaterApp:
     def __init__(self, root):
         self.root = root
@@ -38,7 +69,8 @@ class ModUpdaterApp:
 
         self.mods_dir = None
         self.update_thread = None
-        self.queue = queue.Queue()
+        self._drain_scheduled = False
+        self.queue = _NotifyingQueue(self._schedule_drain)
 
         # --- GUI Setup (No changes in this section) ---
         self.main_frame = ttk.Frame(self.root, padding="10")
@@ -97,34 +129,50 @@ class ModUpdaterApp:
             daemon=True
         )
         self.update_thread.start()
-        self.process_queue()
+
+    def _schedule_drain(self):
+        # Called from the worker thread after each put; a benign race on the
+        # flag only costs an extra no-op wakeup.
+        if self._drain_scheduled:
+            return
+        self._drain_scheduled = True
+        self.root.after_idle(self.process_queue)
 
     def process_queue(self):
-        try:
-            while not self.queue.empty():
+        self._drain_scheduled = False
+        # Coalesce bursts of progress ticks into one .step() per bar per drain
+        # so heavy scanning doesn't turn into O(messages) widget updates.
+        scan_step = api_step = 0
+        finished = False
+        while True:
+            try:
                 msg_type, data = self.queue.get_nowait()
-                if msg_type == "log":
-                    message, tag = data
-                    self.log_message(message, tag)
-                elif msg_type == "error_log":
-                    self.log_message(data, "error")
-                elif msg_type == "scan_progress_config":
-                    self.scan_progress.config(maximum=data)
-                elif msg_type == "scan_progress_update":
-                    self.scan_progress.step(data)
-                elif msg_type == "api_progress_config":
-                    self.api_progress.config(maximum=data)
-                elif msg_type == "api_progress_update":
-                    self.api_progress.step(data)
-                elif msg_type == "done":
-                    self.log_message("--- Update Process Finished ---", "title")
-                    self.start_button.config(state="normal")
-                    self.select_folder_button.config(state="normal")
-                    tk.messagebox.showinfo("Success", "The mod database update process has completed.")
-                    return
-            self.root.after(100, self.process_queue)
-        except queue.Empty:
-            self.root.after(100, self.process_queue)
+            except queue.Empty:
+                break
+            if msg_type == "log":
+                message, tag = data
+                self.log_message(message, tag)
+            elif msg_type == "error_log":
+                self.log_message(data, "error")
+            elif msg_type == "scan_progress_config":
+                if scan_step: self.scan_progress.step(scan_step); scan_step = 0
+                self.scan_progress.config(maximum=data)
+            elif msg_type == "scan_progress_update":
+                scan_step += data
+            elif msg_type == "api_progress_config":
+                if api_step: self.api_progress.step(api_step); api_step = 0
+                self.api_progress.config(maximum=data)
+            elif msg_type == "api_progress_update":
+                api_step += data
+            elif msg_type == "done":
+                finished = True
+        if scan_step: self.scan_progress.step(scan_step)
+        if api_step: self.api_progress.step(api_step)
+        if finished:
+            self.log_message("--- Update Process Finished ---", "title")
+            self.start_button.config(state="normal")
+            self.select_folder_button.config(state="normal")
+            tk.messagebox.showinfo("Success", "The mod database update process has completed.")
     
     def log_message(self, message, tag=None):
         self.log_area.config(state="normal")
@@ -139,8 +187,20 @@ class ModUpdaterApp:
 
 def run_update_logic(mods_dir, q):
     try:
+        # Prefer the high-performance event loops when installed; the API fetch
+        # phase is throughput-bound on the loop implementation.
         if sys.platform == "win32":
-            asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+            try:
+                import winloop
+                asyncio.set_event_loop_policy(winloop.EventLoopPolicy())
+            except ImportError:
+                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        else:
+            try:
+                import uvloop
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+            except ImportError:
+                pass  # stdlib loop is fine on POSIX
         asyncio.run(async_worker(mods_dir, q))
     except Exception as e:
         q.put(("error_log", f"A fatal error occurred in the worker thread: {e}"))
@@ -151,62 +211,115 @@ async def async_worker(mods_dir, q):
     db_data = load_json_db(DB_JSON_FILE, q)
     mods_db = db_data.setdefault("mods", {})
 
+    # Flat index over the nested packageId -> steamId layout so the scan loop
+    # does one dict probe per mod instead of a two-level membership check. The
+    # persisted layout stays nested: db.json is a published artifact.
+    mod_entry_index = {
+        (pkg_id, steam_id): entry
+        for pkg_id, steam_entries in mods_db.items()
+        for steam_id, entry in steam_entries.items()
+    }
+
     q.put(("log", (f"Scanning mods directory: {mods_dir}...", None)))
     mods_to_fetch_from_api, versions_updated_count, mods_added_count = [], 0, 0
     
-    mod_folders = [item for item in mods_dir.iterdir() if item.is_dir() and item.name.isdigit()]
+    # os.scandir reuses the stat data from the directory read, unlike
+    # Path.iterdir which stats each entry again.
+    with os.scandir(mods_dir) as entries:
+        mod_folders = [entry.path for entry in entries
+                       if entry.name.isdigit() and entry.is_dir(follow_symlinks=False)]
     total_mods = len(mod_folders)
     q.put(("scan_progress_config", total_mods))
 
+    # Most mods don't change between runs: compare the stored About.xml mtime
+    # against the file and only parse folders that are new or modified.
+    entry_by_steam_id = {steam_id: entry for (_, steam_id), entry in mod_entry_index.items()}
+    to_parse_paths, to_parse_mtimes = [], []
+    preskipped = 0
+    for folder in mod_folders:
+        about_xml_path = os.path.join(folder, "About", "About.xml")
+        try:
+            mtime_ns = os.stat(about_xml_path).st_mtime_ns
+        except OSError:
+            preskipped += 1  # no About.xml; a parse would have yielded None anyway
+            continue
+        entry = entry_by_steam_id.get(os.path.basename(folder))
+        if entry is not None and entry.get("about_mtime_ns") == mtime_ns:
+            preskipped += 1
+            continue
+        to_parse_paths.append(about_xml_path)
+        to_parse_mtimes.append(mtime_ns)
+    if preskipped:
+        q.put(("log", (f"  - Skipping {preskipped} mods with unchanged About.xml.", None)))
+        q.put(("scan_progress_update", preskipped))
+
+    # XML parsing is CPU-bound, so shard it across a process pool; the DB merge
+    # below stays in this thread to avoid any shared-state issues.
+    total_to_parse = len(to_parse_paths)
     scan_counter = 0
-    for item in mod_folders:
-        scan_counter += 1
-        local_mod_info = extract_mod_info_from_xml(item / "About" / "About.xml", q)
-        if local_mod_info:
-            pkg_id, steam_id_str = local_mod_info["package_id"], local_mod_info["steam_id"]
-            
-            if pkg_id in mods_db and steam_id_str in mods_db[pkg_id]:
-                # --- THIS IS THE NEW LOGIC BLOCK FOR EXISTING MODS ---
-                db_entry = mods_db[pkg_id][steam_id_str]
-                local_versions = set(local_mod_info["data"]["versions"])
-                db_versions = set(db_entry.get("versions", []))
-
-                if not local_versions: # Skip if local has no version info
-                    continue
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        for local_mod_info, about_mtime_ns in zip(
+                pool.map(extract_mod_info_from_xml, to_parse_paths, chunksize=32),
+                to_parse_mtimes):
+            scan_counter += 1
+            if local_mod_info:
+                pkg_id, steam_id_str = local_mod_info["package_id"], local_mod_info["steam_id"]
 
-                if not db_versions: # If DB is empty, local versions win
-                    db_entry["versions"] = sorted(list(local_versions), key=get_version_key)
-                    versions_updated_count += 1
-                    q.put(("log", (f"  - Update '{pkg_id}': Populating empty DB versions.", None)))
-                    continue
-                
-                # Compare using the new version logic
-                max_local_ver_key = get_version_key(max(local_versions, key=get_version_key))
-                max_db_ver_key = get_version_key(max(db_versions, key=get_version_key))
-
-                should_replace = False
-                reason = ""
-                if max_local_ver_key > max_db_ver_key:
-                    should_replace = True
-                    reason = "local has a newer max version"
-                elif max_local_ver_key == max_db_ver_key and len(local_versions) < len(db_versions):
-                    should_replace = True
-                    reason = "local has fewer (more precise) versions"
-                
-                if should_replace and local_versions != db_versions:
-                    db_entry["versions"] = sorted(list(local_versions), key=get_version_key)
-                    versions_updated_count += 1
-                    q.put(("log", (f"  - Update '{pkg_id}': Replacing DB versions because {reason}.", "success")))
-
-            else: # Logic for new packageIds or new steamIds
-                mods_added_count += 1
-                if pkg_id not in mods_db:
-                    mods_db[pkg_id] = {}
-                mods_db[pkg_id][steam_id_str] = local_mod_info["data"]
-                mods_to_fetch_from_api.append((steam_id_str, mods_db[pkg_id][steam_id_str]))
-
-        if scan_counter % BATCH_SIZE == 0 or scan_counter == total_mods:
-            q.put(("scan_progress_update", BATCH_SIZE if scan_counter % BATCH_SIZE == 0 else scan_counter % BATCH_SIZE))
+                db_entry = mod_entry_index.get((pkg_id, steam_id_str))
+                if db_entry is not None:
+                    # --- THIS IS THE NEW LOGIC BLOCK FOR EXISTING MODS ---
+                    # Record the mtime before any early exit so an unchanged
+                    # file is skipped on the next run regardless of outcome.
+                    db_entry["about_mtime_ns"] = about_mtime_ns
+                    local_versions = local_mod_info["data"]["versions"]
+                    if not local_versions: # Skip if local has no version info
+                        continue
+
+                    db_versions = db_entry.get("versions", [])
+                    local_set, db_set = set(local_versions), set(db_versions)
+                    # Common case: versions already match - skip all key work.
+                    if local_set == db_set:
+                        continue
+
+                    # Key each local version exactly once; the key list drives
+                    # both the max comparison and the final sort (decorate-
+                    # sort-undecorate instead of a key= callback per compare).
+                    local_list = list(local_set)
+                    local_keys = list(map(get_version_key, local_list))
+
+                    if not db_versions: # If DB is empty, local versions win
+                        db_entry["versions"] = [v for _, v in sorted(zip(local_keys, local_list))]
+                        versions_updated_count += 1
+                        q.put(("log", (f"  - Update '{pkg_id}': Populating empty DB versions.", None)))
+                        continue
+
+                    max_local_ver_key = max(local_keys)
+                    max_db_ver_key = max(map(get_version_key, db_set))
+
+                    should_replace = False
+                    reason = ""
+                    if max_local_ver_key > max_db_ver_key:
+                        should_replace = True
+                        reason = "local has a newer max version"
+                    elif max_local_ver_key == max_db_ver_key and len(local_set) < len(db_set):
+                        should_replace = True
+                        reason = "local has fewer (more precise) versions"
+
+                    if should_replace:
+                        db_entry["versions"] = [v for _, v in sorted(zip(local_keys, local_list))]
+                        versions_updated_count += 1
+                        q.put(("log", (f"  - Update '{pkg_id}': Replacing DB versions because {reason}.", "success")))
+
+                else: # Logic for new packageIds or new steamIds
+                    mods_added_count += 1
+                    new_entry = local_mod_info["data"]
+                    new_entry["about_mtime_ns"] = about_mtime_ns
+                    mods_db.setdefault(pkg_id, {})[steam_id_str] = new_entry
+                    mod_entry_index[(pkg_id, steam_id_str)] = new_entry
+                    mods_to_fetch_from_api.append((steam_id_str, new_entry))
+
+            if scan_counter % BATCH_SIZE == 0 or scan_counter == total_to_parse:
+                q.put(("scan_progress_update", BATCH_SIZE if scan_counter % BATCH_SIZE == 0 else scan_counter % BATCH_SIZE))
 
     # --- API Fetching Block (No logic change needed here) ---
     if mods_to_fetch_from_api:
@@ -214,29 +327,57 @@ async def async_worker(mods_dir, q):
         total_api_calls = len(mods_to_fetch_from_api)
         q.put(("api_progress_config", total_api_calls))
         
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
         successful_api_updates, failed_api_updates = 0, 0
-        
-        async with aiohttp.ClientSession() as session:
-            tasks = [fetch_steam_details(session, sid, semaphore, q) for sid, _ in mods_to_fetch_from_api]
+
+        # Bound per-host connections explicitly and keep sockets alive so the
+        # burst of API calls reuses TCP/TLS sessions instead of re-handshaking.
+        connector = aiohttp.TCPConnector(
+            limit=64,
+            limit_per_host=MAX_CONCURRENT_REQUESTS,
+            ttl_dns_cache=300,
+            keepalive_timeout=30,
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
             ref_map = {sid: ref for sid, ref in mods_to_fetch_from_api}
-            
+            all_ids = [sid for sid, _ in mods_to_fetch_from_api]
+            # One POST per batch of ids instead of one per mod: N round-trips
+            # become ceil(N / API_BATCH_SIZE).
+            id_batches = [all_ids[i:i + API_BATCH_SIZE] for i in range(0, len(all_ids), API_BATCH_SIZE)]
+
+            # Producer/consumer instead of materializing every coroutine up
+            # front: the worker count *is* the concurrency cap, and in-flight
+            # memory stays O(workers) rather than O(batches).
+            work_q = asyncio.Queue()
+            for batch in id_batches:
+                work_q.put_nowait(batch)
+
             api_counter = 0
-            for future in asyncio.as_completed(tasks):
-                api_counter += 1
-                steam_id, api_result = await future
-                mod_ref = ref_map[steam_id] # Find the mod entry in our DB data
-                if api_result:
-                    # API is the source of truth, so we REPLACE local versions.
-                    mod_ref["versions"] = filter_api_version_tags(api_result.get("tags", []), q)
-                    mod_ref["published"] = True
-                    successful_api_updates += 1
-                else:
-                    mod_ref["published"] = False # Keep local versions as fallback
-                    failed_api_updates += 1
-                
-                if api_counter % BATCH_SIZE == 0 or api_counter == total_api_calls:
-                    q.put(("api_progress_update", BATCH_SIZE if api_counter % BATCH_SIZE == 0 else api_counter % BATCH_SIZE))
+
+            async def api_consumer():
+                nonlocal api_counter, successful_api_updates, failed_api_updates
+                while True:
+                    try:
+                        batch = work_q.get_nowait()
+                    except asyncio.QueueEmpty:
+                        return
+                    batch_results = await fetch_steam_details_batch(session, batch, q)
+                    for steam_id, api_result in batch_results.items():
+                        api_counter += 1
+                        mod_ref = ref_map[steam_id] # Find the mod entry in our DB data
+                        if api_result:
+                            # API is the source of truth, so we REPLACE local versions.
+                            mod_ref["versions"] = filter_api_version_tags(api_result.get("tags", []), q)
+                            mod_ref["published"] = True
+                            successful_api_updates += 1
+                        else:
+                            mod_ref["published"] = False # Keep local versions as fallback
+                            failed_api_updates += 1
+
+                        if api_counter % BATCH_SIZE == 0 or api_counter == total_api_calls:
+                            q.put(("api_progress_update", BATCH_SIZE if api_counter % BATCH_SIZE == 0 else api_counter % BATCH_SIZE))
+
+            worker_count = min(MAX_CONCURRENT_REQUESTS, len(id_batches))
+            await asyncio.gather(*(api_consumer() for _ in range(worker_count)))
 
         q.put(("log", ("\nAPI Fetch Summary:", None)))
         q.put(("log", (f"  - Successfully enriched: {successful_api_updates} mods", "success")))
@@ -244,10 +385,16 @@ async def async_worker(mods_dir, q):
     else:
         q.put(("log", ("\nNo new mods to check against the Steam API.", None)))
 
-    save_json_db(DB_JSON_FILE, db_data, q)
+    # Encode + write on a dedicated thread so the summary reaches the GUI
+    # while the (potentially multi-MB) database is still being serialized.
+    writer = threading.Thread(target=save_json_db, args=(DB_JSON_FILE, db_data, q), daemon=False)
+    writer.start()
     q.put(("log", ("\nFinal Summary:", None)))
     q.put(("log", (f"  - {versions_updated_count} existing mods had their version lists updated.", None)))
     q.put(("log", (f"  - {mods_added_count} new mod entries were added and/or enriched.", None)))
+    # The caller posts "done" as soon as this coroutine returns, so wait for
+    # the writer here - "done" must mean the save is on disk.
+    writer.join()
 
 # --- Helper Functions (largely unchanged) ---
 def load_json_db(filepath, q):
@@ -255,6 +402,9 @@ def load_json_db(filepath, q):
         q.put(("log", (f"INFO: Database file '{filepath}' not found. Starting with a new structure.", None)))
         return {"mods": {}}
     try:
+        if orjson is not None:
+            with open(filepath, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filepath, 'r', encoding='utf-8') as f:
             return json.load(f)
     except Exception as e:
@@ -263,46 +413,108 @@ def load_json_db(filepath, q):
 
 def save_json_db(filepath, data, q):
     try:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # Serialize to one bytes blob and swap it in atomically so a crash
+        # mid-write can never leave a truncated db.json behind.
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=4, ensure_ascii=False).encode('utf-8')
+        tmp_path = filepath.with_suffix('.json.tmp')
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, filepath)
         q.put(("log", (f"INFO: Successfully saved updated database to '{filepath}'", "success")))
     except Exception as e:
         q.put(("error_log", f"ERROR: Could not save data to '{filepath}': {e}"))
 
-def extract_mod_info_from_xml(about_xml_path, q):
+def extract_mod_info_from_xml(about_xml_path):
+    # Streams the document with iterparse instead of building a full DOM: only
+    # four tags are needed, elements are cleared as soon as they are consumed,
+    # and parsing stops early once everything of interest has been seen.
     try:
-        if not about_xml_path.exists(): return None
-        tree = ET.parse(about_xml_path)
-        root = tree.getroot()
-        package_id = (root.findtext('packageId') or "").strip().lower()
+        package_id = name = authors = author = None
+        versions = []
+        in_supported_versions = False
+        versions_done = False
+        depth = 0
+        with open(about_xml_path, 'rb') as f:
+            for event, elem in ET.iterparse(f, events=('start', 'end')):
+                if event == 'start':
+                    depth += 1
+                    if depth == 2 and elem.tag == 'supportedVersions':
+                        in_supported_versions = True
+                    continue
+                depth -= 1
+                if depth == 2:
+                    # Only collect <li> entries that sit directly under
+                    # <supportedVersions>; other lists also use <li>.
+                    if in_supported_versions and elem.tag == 'li' and elem.text:
+                        text = elem.text.strip()
+                        if text: versions.append(text)
+                elif depth == 1:
+                    tag = elem.tag
+                    if tag == 'supportedVersions':
+                        in_supported_versions = False
+                        versions_done = True
+                    elif tag == 'packageId':
+                        # Fail fast: without a usable packageId the rest of
+                        # the document is not worth parsing.
+                        package_id = (elem.text or "").strip().lower()
+                        if not package_id: return None
+                    elif tag == 'name': name = elem.text
+                    elif tag == 'authors': authors = elem.text
+                    elif tag == 'author': author = elem.text
+                elem.clear()
+                if versions_done and package_id and name and (authors or author):
+                    break
         if not package_id: return None
-        versions = [li.text.strip() for li in root.findall('.//supportedVersions/li') if li.text]
         return {
             "package_id": package_id,
-            "steam_id": about_xml_path.parent.parent.name,
-            "data": { "name": (root.findtext('name') or "Unknown Name").strip(), "authors": (root.findtext('authors') or root.findtext('author') or "Unknown Author").strip(), "versions": versions }
+            "steam_id": os.path.basename(os.path.dirname(os.path.dirname(about_xml_path))),
+            "data": { "name": (name or "Unknown Name").strip(), "authors": (authors or author or "Unknown Author").strip(), "versions": versions }
         }
     except Exception: return None
 
+def _is_version_tag(tag: str) -> bool:
+    """True for tags shaped like '1.4' or '1.4.2' (2-3 numeric segments)."""
+    parts = tag.split('.')
+    return 2 <= len(parts) <= 3 and all(p.isdigit() for p in parts)
+
 def filter_api_version_tags(tags, q):
-    version_tags = [tag for tag in tags if VERSION_REGEX.match(tag)]
+    version_tags = [tag for tag in tags if _is_version_tag(tag)]
     # Always sort the versions from the API
     return sorted(version_tags, key=get_version_key)
 
-async def fetch_steam_details(session, steam_id, semaphore, q):
-    async with semaphore:
-        payload = {"itemcount": "1", "publishedfileids[0]": steam_id}
+async def fetch_steam_details_batch(session, steam_ids, q):
+    """Fetches details for a batch of steam_ids in one POST.
+
+    Returns {steam_id: {"tags": [...]}} for successful entries and
+    {steam_id: None} for ids the API could not resolve. Concurrency is
+    bounded by the number of consumer tasks, not a semaphore.
+    """
+    payload = {"itemcount": str(len(steam_ids))}
+    for i, sid in enumerate(steam_ids):
+        payload[f"publishedfileids[{i}]"] = sid
+    results = {sid: None for sid in steam_ids}
+    for attempt in range(RETRY_ATTEMPTS):
         try:
             async with session.post(API_URL, data=payload, timeout=45) as response:
-                if response.status != 200: return steam_id, None
+                if response.status in (429, 500):
+                    # Steam throttling; back off exponentially and retry.
+                    await asyncio.sleep(RETRY_BACKOFF_SECONDS * (2 ** attempt))
+                    continue
+                if response.status != 200: return results
                 data = await response.json()
                 details_list = data.get("response", {}).get("publishedfiledetails", [])
-                if not details_list or details_list[0].get("result") != 1: return steam_id, None
-                details = details_list[0]
-                raw_tags = details.get("tags", [])
-                processed_tags = [t.get("tag") for t in raw_tags if isinstance(t, dict) and t.get("tag")]
-                return steam_id, {"tags": processed_tags}
-        except Exception: return steam_id, None
+                for details in details_list:
+                    sid = str(details.get("publishedfileid", ""))
+                    if sid not in results or details.get("result") != 1: continue
+                    raw_tags = details.get("tags", [])
+                    processed_tags = [t.get("tag") for t in raw_tags if isinstance(t, dict) and t.get("tag")]
+                    results[sid] = {"tags": processed_tags}
+                return results
+        except Exception: return results
+    return results
 
 if __name__ == "__main__":
     app_root = tk.Tk()
@@ -1,7 +1,14 @@
+import functools
 import json
 from pathlib import Path
 from typing import Tuple, List, Dict, Any
 
+try:
+    import numpy as np  # optional: vectorizes the bulk version comparison
+except ImportError:
+    np = None
+
+@functools.lru_cache(maxsize=4096)
 def get_version_key(version_str: str) -> Tuple[int, ...]:
     """
     Converts a version string like '1.5.2' into a tuple (1, 5, 2)
@@ -28,6 +35,34 @@ def get_max_version_key_from_list(versions: List[str]) -> Tuple[int, ...]:
         return (0,)
     return max((get_version_key(v) for v in versions), default=(0,))
 
+def bulk_original_newer(orig_keys: List[Tuple[int, ...]], repl_keys: List[Tuple[int, ...]]) -> List[bool]:
+    """
+    Compares original vs replacement max-version keys pairwise, returning True
+    where the original is strictly newer. Keys are zero-padded to a common
+    width in both paths, so (1, 5) and (1, 5, 0) compare equal and the
+    verdicts do not depend on whether numpy is installed. Uses one vectorized
+    numpy pass when available, otherwise padded tuple comparison.
+    """
+    if np is None or not orig_keys:
+        results = []
+        for o, r in zip(orig_keys, repl_keys):
+            width = max(len(o), len(r))
+            results.append(o + (0,) * (width - len(o)) > r + (0,) * (width - len(r)))
+        return results
+    width = max(max(map(len, orig_keys)), max(map(len, repl_keys)))
+    orig_arr = np.zeros((len(orig_keys), width), dtype=np.int64)
+    repl_arr = np.zeros_like(orig_arr)
+    for i, key in enumerate(orig_keys): orig_arr[i, :len(key)] = key
+    for i, key in enumerate(repl_keys): repl_arr[i, :len(key)] = key
+    # Column-wise lexicographic compare: strictly-greater on the first
+    # component where all earlier components were equal.
+    newer = np.zeros(len(orig_keys), dtype=bool)
+    still_equal = np.ones(len(orig_keys), dtype=bool)
+    for col in range(width):
+        newer |= still_equal & (orig_arr[:, col] > repl_arr[:, col])
+        still_equal &= orig_arr[:, col] == repl_arr[:, col]
+    return newer.tolist()
+
 def create_steam_id_lookup(db_data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     """
     Flattens the db.json structure into a simple dictionary keyed by Steam Workshop ID
@@ -68,50 +103,65 @@ def maintain_replacements_file(replacements_path: Path, db_path: Path):
     steam_id_lookup = create_steam_id_lookup(db_data)
     print(f"Created a lookup table with {len(steam_id_lookup)} entries from {db_path.name}.")
 
+    # Precompute each mod's max version key once; a popular replacement mod can
+    # be referenced by many originals and would otherwise be recomputed per entry.
+    max_key_cache = {
+        steam_id: get_max_version_key_from_list(entry.get("versions", []))
+        for steam_id, entry in steam_id_lookup.items()
+    }
+
     # 3. Iterate through replacements and decide which to keep or remove
     original_mod_entries = replacements_data.get("mods", {})
     kept_mod_entries = {}
     obsolete_mods_info = []
 
     print("\n--- Analyzing replacement entries ---")
+
+    # Pass 1: validate and collect the comparable pairs so the actual version
+    # comparison can run as one bulk operation.
+    warnings: Dict[str, str] = {}
+    comparable_ids: List[str] = []
+    orig_keys: List[Tuple[int, ...]] = []
+    repl_keys: List[Tuple[int, ...]] = []
     for original_steam_id, replacement_info in original_mod_entries.items():
         replacement_steam_id = replacement_info.get("ReplacementSteamId")
         original_mod_name = replacement_info.get('ModName', 'N/A')
 
         # --- Data Validation ---
         if not replacement_steam_id:
-            print(f"  [WARN] Keeping {original_steam_id} ('{original_mod_name}') due to missing 'ReplacementSteamId'.")
-            kept_mod_entries[original_steam_id] = replacement_info
+            warnings[original_steam_id] = f"  [WARN] Keeping {original_steam_id} ('{original_mod_name}') due to missing 'ReplacementSteamId'."
             continue
 
-        original_mod_db_entry = steam_id_lookup.get(original_steam_id)
-        replacement_mod_db_entry = steam_id_lookup.get(replacement_steam_id)
-
-        if not original_mod_db_entry:
-            print(f"  [WARN] Keeping {original_steam_id} ('{original_mod_name}') as it was not found in the database.")
-            kept_mod_entries[original_steam_id] = replacement_info
+        if original_steam_id not in steam_id_lookup:
+            warnings[original_steam_id] = f"  [WARN] Keeping {original_steam_id} ('{original_mod_name}') as it was not found in the database."
             continue
-        
-        if not replacement_mod_db_entry:
+
+        if replacement_steam_id not in steam_id_lookup:
             replacement_name = replacement_info.get('ReplacementName', 'N/A')
-            print(f"  [WARN] Keeping {original_steam_id} as its replacement {replacement_steam_id} ('{replacement_name}') was not found in database.")
-            kept_mod_entries[original_steam_id] = replacement_info
+            warnings[original_steam_id] = f"  [WARN] Keeping {original_steam_id} as its replacement {replacement_steam_id} ('{replacement_name}') was not found in database."
             continue
 
-        # --- Core Comparison Logic ---
-        original_versions = original_mod_db_entry.get("versions", [])
-        replacement_versions = replacement_mod_db_entry.get("versions", [])
-        
-        original_max_version = get_max_version_key_from_list(original_versions)
-        replacement_max_version = get_max_version_key_from_list(replacement_versions)
+        comparable_ids.append(original_steam_id)
+        orig_keys.append(max_key_cache.get(original_steam_id, (0,)))
+        repl_keys.append(max_key_cache.get(replacement_steam_id, (0,)))
 
-        # The rule: An entry is obsolete if the original is strictly newer than the replacement.
-        if original_max_version > replacement_max_version:
+    # The rule: An entry is obsolete if the original is strictly newer than the replacement.
+    obsolete_by_id = dict(zip(comparable_ids, bulk_original_newer(orig_keys, repl_keys)))
+    comparison_keys = dict(zip(comparable_ids, zip(orig_keys, repl_keys)))
+
+    # Pass 2: apply the verdicts in the original file order so the kept
+    # entries (and the printed report) come out in the same order as before.
+    for original_steam_id, replacement_info in original_mod_entries.items():
+        if original_steam_id in warnings:
+            print(warnings[original_steam_id])
+            kept_mod_entries[original_steam_id] = replacement_info
+        elif obsolete_by_id.get(original_steam_id):
+            original_max_version, replacement_max_version = comparison_keys[original_steam_id]
             original_version_str = ".".join(map(str, original_max_version))
             replacement_version_str = ".".join(map(str, replacement_max_version))
             obsolete_mods_info.append({
                 "id": original_steam_id,
-                "name": original_mod_name,
+                "name": replacement_info.get('ModName', 'N/A'),
                 "reason": f"Original version ({original_version_str}) > Replacement version ({replacement_version_str})."
             })
         else:
@@ -1,12 +1,29 @@
+import functools
 import json
+import pickle
+try:
+    import orjson  # optional C-backed JSON; cuts db.json parse time at startup
+except ImportError:
+    orjson = None
+try:
+    import ijson.backends.yajl2_c as ijson  # optional streaming parser (C backend)
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+try:
+    import msgspec  # optional typed decoder; fastest full-parse path
+except ImportError:
+    msgspec = None
 from pathlib import Path
 import sys
-import asyncio
 import re # Keep regex for version parsing, if needed by db.json versions
 from typing import Dict, Any, Optional, List, Tuple
 
 import threading
 import queue
+from concurrent.futures import ThreadPoolExecutor
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
@@ -17,48 +34,139 @@ DB_DIR = ROOT_DIR / "db"
 
 REPLACEMENTS_JSON_FILE = DB_DIR / "replacements.json"
 DB_JSON_FILE = DB_DIR / "db.json"
+DB_FLAT_CACHE_FILE = DB_DIR / "db.flat.pkl" # Derived-data sidecar; safe to delete
+
+
+# --- Helper Functions ---
+# Splits on commas and eats the surrounding whitespace in the same pass,
+# so the flatten loop doesn't strip() every author separately.
+_AUTHOR_RE = re.compile(r'\s*,\s*')
 
 
-# --- Helper Functions (No more scraping-related regex) ---
+@functools.lru_cache(maxsize=4096)
 def get_version_key(version_str: str) -> Tuple[int, ...]:
     try: return tuple(map(int, version_str.split('.')))
     except (ValueError, AttributeError): return (0,)
 
 # --- Global DB Data Cache ---
-# Loads db.json once at startup and flattens it for easy lookup by SteamId
-_GLOBAL_DB_DATA_BY_STEAMID: Dict[str, Dict[str, Any]] = {}
-def _load_and_flatten_db_json():
-    global _GLOBAL_DB_DATA_BY_STEAMID
+# Loads db.json once at startup, flattened into parallel per-field dicts keyed
+# by SteamId (structure-of-arrays): no per-mod container object at all, and a
+# lookup only touches the columns it needs.
+_DB_MODID: Dict[str, str] = {}
+_DB_NAMES: Dict[str, str] = {}
+_DB_VERSIONS: Dict[str, Tuple[str, ...]] = {}
+_DB_MAX_VERSION_KEYS: Dict[str, Tuple[int, ...]] = {}
+_DB_AUTHORS: Dict[str, Tuple[str, ...]] = {}
+_DB_PUBLISHED: Dict[str, bool] = {}
+_DB_COLUMNS = (_DB_MODID, _DB_NAMES, _DB_VERSIONS, _DB_MAX_VERSION_KEYS, _DB_AUTHORS, _DB_PUBLISHED)
+
+if msgspec is not None:
+    class _DbEntry(msgspec.Struct):
+        """Typed view of one db.json mod entry; unknown fields are skipped."""
+        name: str = "Unknown Name"
+        versions: Tuple[str, ...] = ()
+        authors: str = ""
+        published: bool = False
+
+    class _Db(msgspec.Struct):
+        mods: Dict[str, Dict[str, _DbEntry]] = {}
+
+    _DB_DECODER = msgspec.json.Decoder(_Db)
+else:
+    _DB_DECODER = None
+
+def _try_load_flat_cache(src_mtime_ns: int) -> bool:
+    """Restore the flattened columns from the pickle sidecar if it was built
+    from the current db.json. Returns True on a usable cache hit."""
+    try:
+        with open(DB_FLAT_CACHE_FILE, 'rb') as f:
+            cached = pickle.load(f)
+        if cached.get('src_mtime_ns') != src_mtime_ns: return False
+        columns = cached['columns']
+    except (OSError, pickle.UnpicklingError, EOFError, KeyError, IndexError):
+        return False
+    if len(columns) != len(_DB_COLUMNS): return False
+    for column, cached_column in zip(_DB_COLUMNS, columns):
+        column.update(cached_column)
+    return True
+
+def _write_flat_cache(src_mtime_ns: int):
+    try:
+        tmp_path = DB_FLAT_CACHE_FILE.with_suffix('.pkl.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'src_mtime_ns': src_mtime_ns, 'columns': _DB_COLUMNS}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp_path.replace(DB_FLAT_CACHE_FILE)
+    except OSError:
+        pass # The cache is an optimization only; a failed write is not fatal.
+
+def _load_and_flatten_db_json() -> Optional[Tuple[str, str, str]]:
+    """Populate the flattened DB columns. Returns None on success, or a
+    (kind, title, message) tuple the caller can surface once Tk is up —
+    calling messagebox here at import time would spawn a hidden Tk root."""
     if not DB_JSON_FILE.exists():
-        messagebox.showwarning("DB File Missing", f"'{DB_JSON_FILE.name}' not found. Please ensure it exists and is updated by the 'db_updater.py' script.")
-        return
+        return ('warning', "DB File Missing", f"'{DB_JSON_FILE.name}' not found. Please ensure it exists and is updated by the 'db_updater.py' script.")
+    src_mtime_ns = DB_JSON_FILE.stat().st_mtime_ns
+    if _try_load_flat_cache(src_mtime_ns):
+        return None # Unchanged db.json: skip the JSON parse entirely.
     try:
-        with open(DB_JSON_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if "mods" in data and isinstance(data["mods"], dict):
-                for package_id, steam_ids_dict in data["mods"].items():
-                    if isinstance(steam_ids_dict, dict):
-                        for steam_id, details in steam_ids_dict.items():
-                            if steam_id.isdigit(): # Ensure it's a valid Steam ID
-                                _GLOBAL_DB_DATA_BY_STEAMID[steam_id] = {
-                                    "mod_id": package_id, # This is the packageId from db.json
-                                    "name": details.get("name", "Unknown Name"),
-                                    "versions": [v.strip() for v in details.get("versions", []) if isinstance(v, str)], # Ensure versions are stripped strings
-                                    "authors": [a.strip() for a in details.get("authors", "").split(',') if a.strip()], # Authors from db.json
-                                    "published": details.get("published", False) # True means published/valid, False means error/unpublished
-                                }
-    except (json.JSONDecodeError, IOError) as e:
-        messagebox.showerror("DB Load Error", f"Error loading '{DB_JSON_FILE.name}': {e}\nPlease check its format.")
-        _GLOBAL_DB_DATA_BY_STEAMID = {} # Reset to empty on error
-
-_load_and_flatten_db_json() # Load DB on script start
+        with open(DB_JSON_FILE, 'rb') as f:
+            typed = False
+            if _DB_DECODER is not None:
+                # msgspec validates and decodes straight into C-backed structs;
+                # field access below is attribute reads, not dict lookups.
+                mods_items = _DB_DECODER.decode(f.read()).mods.items()
+                typed = True
+            elif ijson is not None:
+                # Stream (packageId -> steamIds) pairs straight off the file so the
+                # full nested tree is never materialized alongside the flat cache.
+                mods_items = ijson.kvitems(f, 'mods')
+            else:
+                data = orjson.loads(f.read()) if orjson is not None else json.loads(f.read())
+                mods = data.get("mods")
+                mods_items = mods.items() if isinstance(mods, dict) else ()
+            # Hoist the per-iteration attribute/global lookups out of the loop;
+            # on a large DB this tight double loop is interpreter-bound.
+            _intern = sys.intern; _isdigit = str.isdigit; _isinstance = isinstance
+            _key = get_version_key; _split_authors = _AUTHOR_RE.split
+            modid_col = _DB_MODID; names_col = _DB_NAMES; versions_col = _DB_VERSIONS
+            maxkey_col = _DB_MAX_VERSION_KEYS; authors_col = _DB_AUTHORS; published_col = _DB_PUBLISHED
+            for package_id, steam_ids_dict in mods_items:
+                if typed or _isinstance(steam_ids_dict, dict):
+                    for steam_id, details in steam_ids_dict.items():
+                        if _isdigit(steam_id): # Ensure it's a valid Steam ID
+                            if typed:
+                                name = details.name; raw_versions = details.versions
+                                raw_authors = details.authors; published = details.published
+                            else:
+                                name = details.get("name", "Unknown Name"); raw_versions = details.get("versions", [])
+                                raw_authors = details.get("authors", ""); published = details.get("published", False)
+                            # Version/author strings repeat across thousands of mods
+                            # ("1.4", "1.5", prolific authors); intern them so each
+                            # unique value is stored once and compares by identity.
+                            versions = tuple(_intern(v.strip()) for v in raw_versions if _isinstance(v, str)) # Ensure versions are stripped strings
+                            modid_col[steam_id] = package_id # This is the packageId from db.json
+                            names_col[steam_id] = name
+                            versions_col[steam_id] = versions
+                            maxkey_col[steam_id] = max(map(_key, versions), default=(0,)) # Immutable after load; computed once here
+                            authors_col[steam_id] = tuple(_intern(a) for a in _split_authors(raw_authors.strip()) if a) # Authors from db.json
+                            published_col[steam_id] = published # True means published/valid, False means error/unpublished
+    except (ValueError, IOError) as e:
+        for column in _DB_COLUMNS:
+            column.clear() # Reset to empty on error
+        return ('error', "DB Load Error", f"Error loading '{DB_JSON_FILE.name}': {e}\nPlease check its format.")
+    _write_flat_cache(src_mtime_ns) # Next launch reloads via pickle, no JSON parse.
+    return None
 
 # --- ModInfo Class ---
 class ModInfo:
+    __slots__ = ('steam_id', 'name', 'authors', 'mod_id', 'versions', 'source',
+                 'is_valid_on_steam', 'max_version_key')
+
     def __init__(self, steam_id: str):
         self.steam_id = steam_id; self.name: Optional[str] = None; self.authors: List[str] = []
         self.mod_id: Optional[str] = None; self.versions: List[str] = []; self.source: str = "N/A"
         self.is_valid_on_steam: bool = False # Now based on db.json's 'published' status
+        self.max_version_key: Tuple[int, ...] = (0,) # Computed once when data arrives
 
 # --- Main Application ---
 class ModReplacerApp:
@@ -66,10 +174,22 @@ class ModReplacerApp:
         self.root = root
         self.root.title("Mod Replacement Manager")
         self.root.geometry("900x550")
+        # Load the DB now that a real Tk root exists; report problems once
+        # the event loop is running instead of blocking construction.
+        load_issue = _load_and_flatten_db_json()
+        if load_issue:
+            kind, title, message = load_issue
+            show = messagebox.showwarning if kind == 'warning' else messagebox.showerror
+            self.root.after(0, lambda: show(title, message))
         self.queue = queue.Queue()
+        # One shared worker pool for all fetches. The fetch path is dict
+        # lookups plus an occasional replacements.json read — no awaitable
+        # I/O — so a plain thread pool replaces the old asyncio machinery.
+        self._fetch_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="fetch")
         self.original_mod: Optional[ModInfo] = None
         self.replacement_mod: Optional[ModInfo] = None
-        self.managing_existing_relationship = False 
+        self.managing_existing_relationship = False
+        self._validate_scheduled = None # Pending after() id for a debounced validate_rules
         
         main_frame = ttk.Frame(root, padding="10"); main_frame.pack(fill=tk.BOTH, expand=True)
         main_frame.columnconfigure(0, weight=1); main_frame.columnconfigure(1, weight=1)
@@ -92,9 +212,19 @@ class ModReplacerApp:
         self.rule3_label.pack(anchor="w")
         self.rule4_label = ttk.Label(rules_frame, textvariable=self.rule4_var) # Storing for later update
         self.rule4_label.pack(anchor="w")
-        
+
+        # Workers fire <<QueueMsg>> after enqueueing, so messages are drained
+        # on demand instead of on a 100ms polling timer.
+        self.root.bind('<<QueueMsg>>', self.process_queue)
         self.process_queue()
 
+    def _notify_queue(self):
+        """Thread-safe wake-up for the GUI; called by workers after q.put."""
+        try:
+            self.root.event_generate('<<QueueMsg>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass # Window is being torn down; the message can be dropped.
+
     def _create_panel(self, parent, title: str, panel_type: str) -> Dict[str, Any]:
         panel_frame = ttk.LabelFrame(parent, text=title, padding="10")
         entry_frame = ttk.Frame(panel_frame); entry_frame.pack(fill=tk.X)
@@ -131,38 +261,59 @@ class ModReplacerApp:
         if not self.managing_existing_relationship or panel_type == 'replacement':
             self._reset_panel_ui(panel_type)
         
-        # The managing_existing_relationship flag is set by async_fetch_worker.
-        threading.Thread(target=run_async_worker, args=(async_fetch_worker, self.queue, panel_type, steam_id), daemon=True).start()
-
-    def process_queue(self):
+        # The managing_existing_relationship flag is set by fetch_worker.
+        self._submit_fetch(panel_type, steam_id)
+
+    def _submit_fetch(self, panel_type: str, steam_id: str):
+        def _run():
+            try:
+                fetch_worker(self.queue, self._notify_queue, panel_type, steam_id)
+            except Exception as e:
+                # Catch any unexpected errors in the worker and send a general failure message
+                self.queue.put(("failure", {"panel_type": "unknown", "steam_id": steam_id, "error": str(e)}))
+                self._notify_queue()
+        self._fetch_pool.submit(_run)
+
+    def process_queue(self, event=None):
+        # Drain everything pending first, keeping only the newest message per
+        # panel, then touch Tk once per panel — a burst (e.g. a two-panel
+        # relationship load) costs one round of widget updates, not one per msg.
+        info_msgs = []
+        panel_msgs: Dict[str, Tuple[str, Dict]] = {}
         try:
             while True:
                 msg_type, data = self.queue.get_nowait()
-                if "info" in msg_type: messagebox.showinfo(msg_type.split('_')[0].title(), data)
-                elif "success" in msg_type:
-                    panel_type = data.pop('panel_type') 
-                    mod_info = ModInfo(data['steam_id']); mod_info.name = data.get('name'); mod_info.authors = data.get('authors', [])
-                    mod_info.versions = data.get('versions', []); mod_info.mod_id = data.get('mod_id'); mod_info.source = data.get('source', "N/A")
-                    mod_info.is_valid_on_steam = data.get('is_valid_on_steam', False) # From db.json published status
-                    if panel_type == 'original': self.original_mod = mod_info
-                    else: self.replacement_mod = mod_info
-                    self._update_panel_ui(panel_type, mod_info)
-
-                    if data.get('is_existing_relationship_load', False):
-                        self.managing_existing_relationship = True
-
-                elif "failure" in msg_type:
-                    panel_type = msg_type.split('_')[0]
-                    if panel_type == 'original': self.original_mod = None
-                    else: self.replacement_mod = None
-                    panel = self.original_panel if panel_type == 'original' else self.replacement_panel
-                    panel["vars"]["source_var"].set("Not Found in DB")
-                    # Special message for DB not found
-                    messagebox.showerror("Mod Not Found", f"Steam ID {data['steam_id']} not found in '{DB_JSON_FILE.name}'.\nPlease ensure the mod is installed and run 'updatetags.py' to update your database.")
-                
-                self._handle_post_fetch_logic()
+                if "info" in msg_type:
+                    info_msgs.append((msg_type, data))
+                else:
+                    panel_type = data.get('panel_type') or msg_type.split('_')[0]
+                    panel_msgs[panel_type] = (msg_type, data)
         except queue.Empty: pass
-        finally: self.root.after(100, self.process_queue)
+        for msg_type, data in info_msgs:
+            messagebox.showinfo(msg_type.split('_')[0].title(), data)
+        for panel_type, (msg_type, data) in panel_msgs.items():
+            if "success" in msg_type:
+                mod_info = ModInfo(data['steam_id']); mod_info.name = data.get('name'); mod_info.authors = data.get('authors', [])
+                mod_info.versions = data.get('versions', []); mod_info.mod_id = data.get('mod_id'); mod_info.source = data.get('source', "N/A")
+                mod_info.is_valid_on_steam = data.get('is_valid_on_steam', False) # From db.json published status
+                mod_info.max_version_key = data.get('max_version_key') or max(map(get_version_key, mod_info.versions), default=(0,))
+                if panel_type == 'original': self.original_mod = mod_info
+                else: self.replacement_mod = mod_info
+                self._update_panel_ui(panel_type, mod_info)
+
+                if data.get('is_existing_relationship_load', False):
+                    self.managing_existing_relationship = True
+
+            elif "failure" in msg_type:
+                if panel_type == 'original': self.original_mod = None
+                else: self.replacement_mod = None
+                panel = self.original_panel if panel_type == 'original' else self.replacement_panel
+                panel["vars"]["source_var"].set("Not Found in DB")
+                # Special message for DB not found
+                messagebox.showerror("Mod Not Found", f"Steam ID {data['steam_id']} not found in '{DB_JSON_FILE.name}'.\nPlease ensure the mod is installed and run 'updatetags.py' to update your database.")
+
+        if panel_msgs:
+            self._handle_post_fetch_logic()
 
     def _handle_post_fetch_logic(self):
         # Apply locking/unlocking based on whether we're managing an existing entry
@@ -175,15 +326,24 @@ class ModReplacerApp:
         if self.original_mod and self.original_mod.is_valid_on_steam and \
            self.replacement_mod and self.replacement_mod.is_valid_on_steam:
             
-            replacements = load_replacements_file().get("mods", {})
             orig_id, repl_id = self.original_mod.steam_id, self.replacement_mod.steam_id
-            
-            existing_entry_key = find_relationship_key_strict(orig_id, repl_id, replacements)
+
+            existing_entry_key = find_relationship_key_strict(orig_id, repl_id)
 
             if existing_entry_key:
                 # Removed auto-update/cleanup logic from here, as per requirements.
                 pass
-        
+
+        self.schedule_validate()
+
+    def schedule_validate(self):
+        """Coalesce bursts of updates (e.g. a two-panel relationship load)
+        into a single validate_rules pass shortly after the last trigger."""
+        if self._validate_scheduled is not None: return
+        self._validate_scheduled = self.root.after(30, self._do_validate)
+
+    def _do_validate(self):
+        self._validate_scheduled = None
         self.validate_rules()
 
     def _update_panel_ui(self, panel_type: str, mod_info: ModInfo):
@@ -213,7 +373,7 @@ class ModReplacerApp:
         self._unlock_all_panels()
         self._reset_panel_ui("original"); self._reset_panel_ui("replacement")
         self.managing_existing_relationship = False
-        self.validate_rules()
+        self.schedule_validate()
 
     def _lock_panel(self, panel_type):
         panel = self.original_panel if panel_type == 'original' else self.replacement_panel
@@ -235,27 +395,19 @@ class ModReplacerApp:
         button_mode = "add"
         
         if self.original_mod and self.replacement_mod: # Only validate relationship rules if both mods are loaded
-            replacements = load_replacements_file().get("mods", {})
-            
+            orig_is_key, orig_repl_id = get_relationship_state(self.original_mod.steam_id)
+
             # Rule 3: Is a new relationship? (Unidirectional check)
             # It's "new" if the original mod's Steam ID is NOT ALREADY A KEY in the replacements file.
-            if self.original_mod.steam_id in replacements:
-                rule3_ok = False # Original mod is already involved in a relationship (as a key)
-            else:
-                rule3_ok = True # Original mod is new, so this is potentially a new relationship
-            
+            rule3_ok = not orig_is_key
+
             # Rule 4: Replacement is up-to-date
-            max_orig_ver = max(self.original_mod.versions, key=get_version_key) if self.original_mod.versions else "0"
-            max_repl_ver = max(self.replacement_mod.versions, key=get_version_key) if self.replacement_mod.versions else "0"
-            rule4_ok = get_version_key(max_repl_ver) >= get_version_key(max_orig_ver)
+            rule4_ok = self.replacement_mod.max_version_key >= self.original_mod.max_version_key
 
             # Determine button mode based on existing relationship and loaded mods
-            existing_exact_relationship_loaded = (self.original_mod.steam_id in replacements and 
-                                                  replacements[self.original_mod.steam_id].get("ReplacementSteamId") == self.replacement_mod.steam_id)
-
-            if existing_exact_relationship_loaded:
+            if orig_is_key and orig_repl_id == self.replacement_mod.steam_id:
                 button_mode = "view/remove" # The exact pair is loaded, allow removal
-            elif self.original_mod.steam_id in replacements:
+            elif orig_is_key:
                 # Original mod exists (as a key), but this replacement is different
                 button_mode = "change"
             else:
@@ -315,35 +467,29 @@ class ModReplacerApp:
         return { "Author": ", ".join(orig.authors), "ModId": orig.mod_id or "", "ModName": orig.name, "Versions": ",".join(orig.versions), "SteamId": orig.steam_id, "ReplacementAuthor": ", ".join(repl.authors), "ReplacementModId": repl.mod_id or "", "ReplacementName": repl.name, "ReplacementSteamId": repl.steam_id, "ReplacementVersions": ",".join(repl.versions),}
 
 
-def run_async_worker(async_func, q, *args):
-    try:
-        if sys.platform == "win32": asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        asyncio.run(async_func(q, *args))
-    except Exception as e:
-        # Catch any unexpected errors in the worker and send a general failure message
-        q.put(("failure", {"panel_type": "unknown", "steam_id": args[-1], "error": str(e)}))
-
-# Renamed _fetch_and_combine to reflect its new purpose: fetching from DB only
-async def get_mod_info_from_db(steam_id: str) -> Optional[Dict]:
-    mod_data = _GLOBAL_DB_DATA_BY_STEAMID.get(steam_id)
-    if mod_data:
+# Renamed _fetch_and_combine to reflect its new purpose: fetching from DB only.
+# The DB columns are immutable after load, so the assembled record is memoized:
+# refetching the same mod returns the cached dict with no allocation. Callers
+# must treat the returned dict as read-only (spread it, don't mutate it).
+@functools.lru_cache(maxsize=1024)
+def get_mod_info_from_db(steam_id: str) -> Optional[Dict]:
+    if steam_id in _DB_NAMES:
         # Map db.json fields to ModInfo fields
         return {
             "steam_id": steam_id,
-            "name": mod_data.get("name"),
-            "authors": mod_data.get("authors"),
-            "mod_id": mod_data.get("mod_id"),
-            "versions": mod_data.get("versions"),
+            "name": _DB_NAMES[steam_id],
+            "authors": _DB_AUTHORS[steam_id],
+            "mod_id": _DB_MODID[steam_id],
+            "versions": _DB_VERSIONS[steam_id],
+            "max_version_key": _DB_MAX_VERSION_KEYS[steam_id],
             "source": "DB.json",
-            "is_valid_on_steam": mod_data.get("published", False)
+            "is_valid_on_steam": _DB_PUBLISHED[steam_id]
         }
     return None
 
-async def async_fetch_worker(q: queue.Queue, clicked_panel_type: str, steam_id: str):
-    replacements = load_replacements_file().get("mods", {})
-    
+def fetch_worker(q: queue.Queue, notify, clicked_panel_type: str, steam_id: str):
     # Try to find a relationship where this SteamID is the ORIGINAL mod
-    relationship_as_original = get_relationship_info_from_json_as_original(steam_id, replacements)
+    relationship_as_original = get_relationship_info_from_json_as_original(steam_id)
 
     if relationship_as_original:
         # Case 1: User entered an ID that IS an ORIGINAL in an existing relationship.
@@ -351,54 +497,80 @@ async def async_fetch_worker(q: queue.Queue, clicked_panel_type: str, steam_id:
         orig_id, repl_id = relationship_as_original
 
         # Fetch data for the original mod and send to the original panel
-        original_mod_data = await get_mod_info_from_db(orig_id)
+        original_mod_data = get_mod_info_from_db(orig_id)
         if original_mod_data:
             q.put(("success", {**original_mod_data, 'panel_type': 'original', 'is_existing_relationship_load': True}))
         else:
             q.put(("failure", {'panel_type': 'original', 'steam_id': orig_id}))
+        notify()
 
         # Fetch data for the replacement mod and send to the replacement panel
-        replacement_mod_data = await get_mod_info_from_db(repl_id)
+        replacement_mod_data = get_mod_info_from_db(repl_id)
         if replacement_mod_data:
             q.put(("success", {**replacement_mod_data, 'panel_type': 'replacement', 'is_existing_relationship_load': True}))
         else:
             q.put(("failure", {'panel_type': 'replacement', 'steam_id': repl_id}))
+        notify()
 
     else:
         # Case 2: User entered an ID that is NOT an ORIGINAL in an existing relationship.
         # This could be a new mod, or a replacement mod that is already replacing other originals.
         # We only load the clicked mod into its respective panel.
-        primary_data = await get_mod_info_from_db(steam_id)
+        primary_data = get_mod_info_from_db(steam_id)
         if primary_data:
             q.put((f"{clicked_panel_type}_success", {**primary_data, 'panel_type': clicked_panel_type, 'is_existing_relationship_load': False}))
         else:
             q.put((f"{clicked_panel_type}_failure", {'panel_type': clicked_panel_type, 'steam_id': steam_id}))
+        notify()
+
 
+# Monotonic counter for the replacements data; bumped whenever the cached
+# data changes (reload from disk or an in-app save). Keying the memoized
+# relationship lookup on it makes stale cache entries unreachable.
+_REPL_VERSION = 0
 
-def get_relationship_info_from_json_as_original(steam_id: str, replacements: Dict) -> Optional[Tuple[str, str]]:
+@functools.lru_cache(maxsize=1024)
+def _relationship_state(orig_id: str, version: int) -> Tuple[bool, Optional[str]]:
+    entry = load_replacements_file().get("mods", {}).get(orig_id)
+    if entry is None:
+        return False, None
+    return True, entry.get("ReplacementSteamId")
+
+def get_relationship_state(orig_id: str) -> Tuple[bool, Optional[str]]:
+    """
+    Returns (is_original_key, replacement_steam_id) for the given id against
+    the current replacements data. Cached per data version, so the repeated
+    membership checks during validation are O(1) after the first call.
+    """
+    return _relationship_state(orig_id, _REPL_VERSION)
+
+
+def get_relationship_info_from_json_as_original(steam_id: str) -> Optional[Tuple[str, str]]:
     """
     Checks if the given steam_id exists as an ORIGINAL mod (key) in the JSON.
     Returns (original_steam_id, replacement_steam_id) if found, else None.
     This makes detection strictly unidirectional for loading.
     """
-    if steam_id in replacements: # steam_id is an original
-        return steam_id, replacements[steam_id].get("ReplacementSteamId")
+    is_key, replacement_id = get_relationship_state(steam_id)
+    if is_key: # steam_id is an original
+        return steam_id, replacement_id
     return None
 
 
-def find_relationship_key_strict(id1, id2, replacements):
+def find_relationship_key_strict(id1, id2):
     """
     Finds the original_steam_id key for a specific relationship (id1 -> id2).
     Returns the original_steam_id key if the exact relationship is found.
     """
-    if id1 in replacements and replacements[id1].get("ReplacementSteamId") == id2:
+    is_key, replacement_id = get_relationship_state(id1)
+    if is_key and replacement_id == id2:
         return id1
     return None
 
 def fetch_from_json_file(steam_id: str) -> Optional[Dict]:
     """
     This function is now ONLY used to check `replacements.json` for *relationship info*,
-    not for mod details (which come from _GLOBAL_DB_DATA_BY_STEAMID).
+    not for mod details (which come from the flattened _DB_* columns).
     It checks if a steam_id exists as an original or a replacement in any entry
     to help in `_fetch_and_combine` (though _fetch_and_combine is simplified now).
     It returns raw dictionary from replacements.json.
@@ -406,20 +578,56 @@ def fetch_from_json_file(steam_id: str) -> Optional[Dict]:
     data = load_replacements_file().get("mods", {})
     if steam_id in data: # Check if it's an original mod
         return data[steam_id]
-    for mod_data in data.values(): # Check if it's a replacement mod
-        if mod_data.get("ReplacementSteamId") == steam_id:
-            return mod_data
+    original_id = get_replacement_reverse_index().get(steam_id) # Check if it's a replacement mod
+    if original_id is not None:
+        return data.get(original_id)
     return None
 
 
+# Parsed replacements.json, keyed on the file's mtime. validate_rules and the
+# fetch workers call load_replacements_file constantly; re-parsing the file on
+# each call is wasted I/O when it only changes through save_replacements_file.
+_REPL_CACHE: Dict[str, Any] = {"mtime": None, "data": None, "reverse": {}}
+
+def _build_reverse_index(data: Dict) -> Dict[str, str]:
+    return {v["ReplacementSteamId"]: k
+            for k, v in data.get("mods", {}).items() if v.get("ReplacementSteamId")}
+
 def load_replacements_file() -> Dict:
+    global _REPL_VERSION
     if not REPLACEMENTS_JSON_FILE.exists(): return {"mods": {}}
     try:
-        with open(REPLACEMENTS_JSON_FILE, 'r', encoding='utf-8') as f: return json.load(f)
-    except (json.JSONDecodeError, IOError): return {"mods": {}}
+        mtime = REPLACEMENTS_JSON_FILE.stat().st_mtime_ns
+        if mtime == _REPL_CACHE["mtime"]:
+            return _REPL_CACHE["data"]
+        with open(REPLACEMENTS_JSON_FILE, 'rb') as f:
+            data = orjson.loads(f.read()) if orjson is not None else json.loads(f.read())
+        _REPL_CACHE["mtime"] = mtime; _REPL_CACHE["data"] = data
+        _REPL_CACHE["reverse"] = _build_reverse_index(data)
+        _REPL_VERSION += 1 # Invalidate memoized relationship lookups
+        return data
+    except (ValueError, IOError): return {"mods": {}}
+
+def get_replacement_reverse_index() -> Dict[str, str]:
+    """
+    Maps ReplacementSteamId -> original steam_id for O(1) replacement-side
+    lookups. Kept in sync with the cached replacements data.
+    """
+    data = load_replacements_file()
+    if data is _REPL_CACHE["data"]:
+        return _REPL_CACHE["reverse"]
+    return _build_reverse_index(data)
 
 def save_replacements_file(data: Dict):
-    with open(REPLACEMENTS_JSON_FILE, 'w', encoding='utf-8') as f: json.dump(data, f, indent=2, ensure_ascii=False)
+    global _REPL_VERSION
+    if orjson is not None:
+        with open(REPLACEMENTS_JSON_FILE, 'wb') as f: f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(REPLACEMENTS_JSON_FILE, 'w', encoding='utf-8') as f: json.dump(data, f, indent=2, ensure_ascii=False)
+    _REPL_CACHE["mtime"] = REPLACEMENTS_JSON_FILE.stat().st_mtime_ns
+    _REPL_CACHE["data"] = data
+    _REPL_CACHE["reverse"] = _build_reverse_index(data)
+    _REPL_VERSION += 1 # Invalidate memoized relationship lookups
 
 def validate_mod_id_string(mod_id: str) -> Tuple[bool, str]:
     # This function is technically not used anymore for user input ModId validation
@@ -1,9 +1,40 @@
 import json
+try:
+    import orjson  # optional C-backed JSON; db.json/rules.json parse + dump speedup
+except ImportError:
+    orjson = None
+try:
+    import msgspec  # optional typed decoder for rules.json
+except ImportError:
+    msgspec = None
+try:
+    import cysimdjson  # optional lazy parser; avoids materializing every db.json mod
+except ImportError:
+    cysimdjson = None
+try:
+    import ijson.backends.yajl2_c as ijson  # optional streaming parser (C backend)
+except ImportError:
+    try:
+        import ijson
+    except ImportError:
+        ijson = None
+try:
+    import pygtrie  # optional char trie; O(len(prefix)) packageId prefix walks
+except ImportError:
+    pygtrie = None
+import bisect
+import collections
+import functools
+import mmap
+import os
 from pathlib import Path
+import sqlite3
 import sys
 import re
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional, List, Tuple, Union
-import asyncio
 
 import threading
 import queue
@@ -19,6 +50,28 @@ DB_DIR = ROOT_DIR / "db"
 RULES_JSON_FILE = DB_DIR / "rules.json"
 DB_JSON_FILE = DB_DIR / "db.json"  # Source for mod names/authors
 
+# Compiled once: Steam IDs are strictly ASCII digits (str.isdigit also
+# accepts unicode digit characters), and comma-splits strip the surrounding
+# whitespace in the same pass instead of a per-element strip().
+_SID_MATCH = re.compile(r'\A\d+\Z').match
+_CSV_SPLIT = re.compile(r'\s*,\s*').split
+
+def _norm(s: str) -> str:
+    """Canonical packageId form: stripped, casefolded, and interned. The same
+    ids recur across the DB index, the rules dict, and every treeview row;
+    interning collapses the copies to one str object and makes dict/set probes
+    on them hit CPython's pointer-equality fast path. Applying the same step
+    on the lookup side keeps that identity short-circuit for probes too."""
+    return sys.intern(s.strip().casefold())
+
+def _is_valid_pkg_id(s: str) -> bool:
+    """Fast-reject for input that provably cannot be a packageId: empty, or
+    containing control characters. Nothing stricter is safe — the catalogue
+    itself holds ids with interior spaces, unicode letters, and punctuation
+    like & and ' — so any printable string passes. str.isprintable is a
+    single C-level scan, cheaper than a per-character set probe."""
+    return bool(s) and s.isprintable()
+
 # --- Helper Functions ---
 # (Using get_version_key from previous scripts for consistency, though not strictly for comparison here)
 def get_version_key(version_str: str) -> Tuple[int, ...]:
@@ -30,94 +83,428 @@ def get_version_key(version_str: str) -> Tuple[int, ...]:
 _GLOBAL_DB_MOD_DETAILS: Dict[str, Dict[str, Any]] = {} # Maps SteamID -> {package_id, name, authors, versions, published}
 _GLOBAL_DB_PACKAGEID_TO_STEAMID: Dict[str, List[str]] = {} # Maps packageId -> [SteamIDs]
 
+# Lazy backend (cysimdjson): the parsed document is kept around and individual
+# mod entries are only materialized into _GLOBAL_DB_MOD_DETAILS on first
+# lookup. The UI reads details for one typed packageId at a time, so eagerly
+# building dicts for every catalogued mod is wasted startup work.
+_GLOBAL_DB_LAZY_PARSER = None # Must outlive the document it parsed
+_GLOBAL_DB_LAZY_DOC = None
+_GLOBAL_DB_LAZY_POINTERS: Dict[str, str] = {} # Maps SteamID -> JSON pointer into the lazy doc
+
+# Streaming backend (ijson): raw, unprocessed leaf values per SteamID; the
+# processed details dict is built on first lookup. Middle ground between the
+# lazy document (needs cysimdjson) and the full eager flatten.
+_GLOBAL_DB_RAW_DETAILS: Dict[str, Tuple[str, Tuple, str, bool, str]] = {} # sid -> (name, versions, authors_csv, published, pkg_l)
+
+# Chosen SteamID per packageId, computed once at load time so lookups do two
+# dict gets instead of scanning every reupload for a published one. The lazy
+# backend skips these (reading 'published' would defeat its laziness) and
+# keeps the scan fallback below.
+_PUBLISHED_STEAMID_FOR_PKG: Dict[str, str] = {}
+_ANY_STEAMID_FOR_PKG: Dict[str, str] = {}
+
+# Compact packageId -> display name tier for the dialog autofill, which only
+# ever needs the name. The eager and streaming backends fill it at load time;
+# the sqlite and lazy backends warm it per hit. Two small strings per mod
+# instead of a details dict, answered with one dict probe.
+_PKG_NAME_INDEX: Dict[str, str] = {}
+
+# Prefix index over every known packageId, built once after the DB loads.
+# Lets the autofill answer "does anything start with what's typed so far?"
+# without a lookup miss per keystroke, and complete the display name early
+# when the prefix is already unambiguous. pygtrie gives O(len(prefix)) walks;
+# the bisect fallback over the sorted key list is O(log n) per probe.
+_DB_TRIE = None # pygtrie.CharTrie when the dependency is available
+_PKG_ID_SORTED: List[str] = []
+
+# SQLite sidecar: a queryable copy of db.json, stamped with the source mtime
+# and rebuilt in the background whenever the JSON changes. When fresh, startup
+# skips parsing db.json entirely and lookups become indexed B-tree probes with
+# constant memory. db.json stays the source of truth; the sidecar is
+# disposable and never committed.
+DB_SQLITE_CACHE_FILE = DB_DIR / "db.cache.sqlite"
+_GLOBAL_DB_SQLITE_CONN: Optional[sqlite3.Connection] = None
+
+def _try_sqlite_db_load() -> bool:
+    """Open the sidecar read-only if it matches db.json's current mtime."""
+    global _GLOBAL_DB_SQLITE_CONN
+    if not DB_SQLITE_CACHE_FILE.exists():
+        return False
+    try:
+        # Read-only and shared across the UI and fetch worker threads; fine
+        # because nothing writes through this connection.
+        conn = sqlite3.connect(f"file:{DB_SQLITE_CACHE_FILE}?mode=ro", uri=True, check_same_thread=False)
+        row = conn.execute("SELECT value FROM meta WHERE key = 'source_mtime_ns'").fetchone()
+        if row is None or int(row[0]) != DB_JSON_FILE.stat().st_mtime_ns:
+            conn.close()
+            return False
+        _GLOBAL_DB_SQLITE_CONN = conn
+        return True
+    except Exception:
+        return False
+
+def _sqlite_lookup(package_id_l: str) -> Optional[Dict[str, Any]]:
+    """Details for one packageId, preferring a published SteamID (the ORDER BY
+    mirrors the published-first choice of the in-memory backends)."""
+    try:
+        row = _GLOBAL_DB_SQLITE_CONN.execute(
+            "SELECT package_id, name, versions, authors, published FROM mods"
+            " WHERE package_id = ? ORDER BY published DESC, rowid LIMIT 1",
+            (package_id_l,)).fetchone()
+    except Exception:
+        return None
+    if row is None:
+        return None
+    return {
+        "package_id": row[0],
+        "name": row[1],
+        "versions": [v for v in _CSV_SPLIT(row[2].strip()) if v] if row[2] else [],
+        "authors": [a for a in _CSV_SPLIT(row[3].strip()) if a] if row[3] else [],
+        "published": bool(row[4]),
+    }
+
+def _rebuild_sqlite_sidecar(source_mtime_ns: int):
+    """Rebuild the sidecar from db.json (run on a background thread). Built
+    in a temp file and swapped in atomically so a crash mid-build cannot
+    leave a corrupt cache for the next launch."""
+    tmp_path = DB_SQLITE_CACHE_FILE.with_suffix('.sqlite.tmp')
+    try:
+        raw = DB_JSON_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        mods = data.get("mods")
+        if not isinstance(mods, dict):
+            return
+        tmp_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(tmp_path)
+        conn.execute("CREATE TABLE meta(key TEXT PRIMARY KEY, value TEXT)")
+        # Keyed on the pair: the same steam_id can be listed under several
+        # packageIds in db.json, and each packageId must keep its row.
+        conn.execute("CREATE TABLE mods(steam_id TEXT NOT NULL, package_id TEXT NOT NULL,"
+                     " name TEXT, versions TEXT, authors TEXT, published INTEGER,"
+                     " PRIMARY KEY(package_id, steam_id))")
+        rows = (
+            (steam_id, _norm(pkg), d.get("name", "Unknown Name"),
+             ",".join(v.strip() for v in d.get("versions", []) if isinstance(v, str)),
+             d.get("authors", ""), 1 if d.get("published", False) else 0)
+            for pkg, sids in mods.items() if isinstance(sids, dict)
+            for steam_id, d in sids.items() if _SID_MATCH(steam_id)
+        )
+        conn.executemany("INSERT OR REPLACE INTO mods VALUES (?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("CREATE INDEX idx_mods_pkg ON mods(package_id, published DESC)")
+        conn.execute("INSERT INTO meta VALUES ('source_mtime_ns', ?)", (str(source_mtime_ns),))
+        conn.commit(); conn.close()
+        os.replace(tmp_path, DB_SQLITE_CACHE_FILE)
+    except Exception:
+        try: tmp_path.unlink(missing_ok=True)
+        except OSError: pass
+
+def _json_pointer_token(token: str) -> str:
+    return token.replace('~', '~0').replace('/', '~1')
+
+def _try_lazy_db_load() -> bool:
+    """Parse db.json with cysimdjson, building only the packageId index and
+    per-mod pointers. Returns False so the caller can fall back eagerly."""
+    global _GLOBAL_DB_LAZY_PARSER, _GLOBAL_DB_LAZY_DOC
+    try:
+        parser = cysimdjson.JSONParser()
+        doc = parser.parse(DB_JSON_FILE.read_bytes())
+        mods = doc.at_pointer('/mods')
+        for package_id in mods.keys():
+            pkg_l = _norm(package_id)
+            sid_list = _GLOBAL_DB_PACKAGEID_TO_STEAMID.setdefault(pkg_l, [])
+            pkg_token = _json_pointer_token(package_id)
+            for steam_id in mods[package_id].keys():
+                if _SID_MATCH(steam_id):
+                    sid_list.append(steam_id)
+                    _GLOBAL_DB_LAZY_POINTERS[steam_id] = f"/mods/{pkg_token}/{steam_id}"
+        _GLOBAL_DB_LAZY_PARSER = parser; _GLOBAL_DB_LAZY_DOC = doc
+        return True
+    except Exception:
+        # Anything unexpected from the lazy backend: discard partial state
+        # and let the eager stdlib/orjson path handle the file.
+        _GLOBAL_DB_PACKAGEID_TO_STEAMID.clear(); _GLOBAL_DB_LAZY_POINTERS.clear()
+        _GLOBAL_DB_LAZY_PARSER = None; _GLOBAL_DB_LAZY_DOC = None
+        return False
+
+def _materialize_lazy_details(steam_id: str, package_id_l: str) -> Optional[Dict[str, Any]]:
+    """Build (and cache) the details dict for one mod from the lazy doc."""
+    pointer = _GLOBAL_DB_LAZY_POINTERS.get(steam_id)
+    if pointer is None or _GLOBAL_DB_LAZY_DOC is None:
+        return None
+    try:
+        raw = _GLOBAL_DB_LAZY_DOC.at_pointer(pointer)
+        def _get(key, default):
+            try: return raw[key]
+            except (KeyError, TypeError): return default
+        details = {
+            "package_id": package_id_l, # Store package_id normalized
+            "name": _get("name", "Unknown Name"),
+            "versions": [v.strip() for v in _get("versions", []) if isinstance(v, str)],
+            "authors": [a for a in _CSV_SPLIT(_get("authors", "").strip()) if a],
+            "published": bool(_get("published", False))
+        }
+    except Exception:
+        return None
+    _GLOBAL_DB_MOD_DETAILS[steam_id] = details
+    return details
+
+def _try_stream_db_load() -> bool:
+    """Stream db.json with ijson, keeping only the index and raw leaf values.
+    Avoids holding the nested tree and the processed dicts at once. Note the
+    dotted packageIds rule out per-subtree ijson prefixes, so this streams
+    the whole 'mods' map once and defers only the per-mod processing."""
+    try:
+        with open(DB_JSON_FILE, 'rb') as f:
+            for package_id, steam_ids_dict in ijson.kvitems(f, 'mods'):
+                if isinstance(steam_ids_dict, dict):
+                    pkg_l = _norm(package_id)
+                    sid_list = _GLOBAL_DB_PACKAGEID_TO_STEAMID.setdefault(pkg_l, [])
+                    for steam_id, details in steam_ids_dict.items():
+                        if _SID_MATCH(steam_id):
+                            sid_list.append(steam_id)
+                            if details.get("published", False):
+                                if pkg_l not in _PUBLISHED_STEAMID_FOR_PKG:
+                                    _PUBLISHED_STEAMID_FOR_PKG[pkg_l] = steam_id
+                                    _PKG_NAME_INDEX[pkg_l] = details.get("name", "Unknown Name")
+                            if pkg_l not in _ANY_STEAMID_FOR_PKG:
+                                _ANY_STEAMID_FOR_PKG[pkg_l] = steam_id
+                                _PKG_NAME_INDEX.setdefault(pkg_l, details.get("name", "Unknown Name"))
+                            _GLOBAL_DB_RAW_DETAILS[steam_id] = (
+                                details.get("name", "Unknown Name"),
+                                tuple(details.get("versions", [])),
+                                details.get("authors", ""),
+                                details.get("published", False),
+                                pkg_l,
+                            )
+        return True
+    except Exception:
+        _GLOBAL_DB_PACKAGEID_TO_STEAMID.clear(); _GLOBAL_DB_RAW_DETAILS.clear()
+        _PUBLISHED_STEAMID_FOR_PKG.clear(); _ANY_STEAMID_FOR_PKG.clear()
+        _PKG_NAME_INDEX.clear()
+        return False
+
+def _get_details_for_steam_id(steam_id: str, package_id_l: str) -> Optional[Dict[str, Any]]:
+    details = _GLOBAL_DB_MOD_DETAILS.get(steam_id)
+    if details is None and _GLOBAL_DB_LAZY_DOC is not None:
+        details = _materialize_lazy_details(steam_id, package_id_l)
+    if details is None and steam_id in _GLOBAL_DB_RAW_DETAILS:
+        name, versions, authors_csv, published, pkg_l = _GLOBAL_DB_RAW_DETAILS.pop(steam_id)
+        details = {
+            "package_id": pkg_l, # Store package_id normalized
+            "name": name,
+            "versions": [v.strip() for v in versions if isinstance(v, str)],
+            "authors": [a for a in _CSV_SPLIT(authors_csv.strip()) if a],
+            "published": published
+        }
+        _GLOBAL_DB_MOD_DETAILS[steam_id] = details
+    return details
+
+def _build_prefix_index():
+    """Collects every known packageId into the prefix index. The id universe
+    comes from whichever backend loaded: one indexed column scan on sqlite,
+    otherwise the packageId->SteamIDs map the JSON backends all populate."""
+    global _DB_TRIE
+    if _GLOBAL_DB_SQLITE_CONN is not None:
+        ids = [row[0] for row in
+               _GLOBAL_DB_SQLITE_CONN.execute("SELECT DISTINCT package_id FROM mods")]
+    else:
+        ids = list(_GLOBAL_DB_PACKAGEID_TO_STEAMID)
+    _PKG_ID_SORTED[:] = sorted(ids)
+    if pygtrie is not None and ids:
+        trie = pygtrie.CharTrie()
+        for pid in _PKG_ID_SORTED:
+            trie[pid] = True
+        _DB_TRIE = trie
+
+def _pkg_id_prefix_state(prefix: str) -> Tuple[bool, Optional[str]]:
+    """Returns (some id starts with prefix, the sole such id or None)."""
+    if _DB_TRIE is not None:
+        try:
+            keys = _DB_TRIE.iterkeys(prefix=prefix)
+            first = next(keys)
+        except KeyError:
+            return False, None
+        return True, first if next(keys, None) is None else None
+    i = bisect.bisect_left(_PKG_ID_SORTED, prefix)
+    if i == len(_PKG_ID_SORTED) or not _PKG_ID_SORTED[i].startswith(prefix):
+        return False, None
+    if i + 1 == len(_PKG_ID_SORTED) or not _PKG_ID_SORTED[i + 1].startswith(prefix):
+        return True, _PKG_ID_SORTED[i]
+    return True, None
+
 def _load_and_flatten_db_json():
-    global _GLOBAL_DB_MOD_DETAILS, _GLOBAL_DB_PACKAGEID_TO_STEAMID
+    global _GLOBAL_DB_MOD_DETAILS, _GLOBAL_DB_PACKAGEID_TO_STEAMID, _GLOBAL_DB_SQLITE_CONN
     _GLOBAL_DB_MOD_DETAILS = {}
     _GLOBAL_DB_PACKAGEID_TO_STEAMID = {}
+    if _GLOBAL_DB_SQLITE_CONN is not None:
+        _GLOBAL_DB_SQLITE_CONN.close(); _GLOBAL_DB_SQLITE_CONN = None
+    _PUBLISHED_STEAMID_FOR_PKG.clear(); _ANY_STEAMID_FOR_PKG.clear()
+    _PKG_NAME_INDEX.clear()
+    global _DB_TRIE
+    _DB_TRIE = None; _PKG_ID_SORTED.clear()
+    # Defined below the initial import-time load; only set on a reload.
+    cached = globals().get('_get_mod_details_cached')
+    if cached is not None:
+        cached.cache_clear()
 
     if not DB_JSON_FILE.exists():
         messagebox.showwarning("DB File Missing", f"'{DB_JSON_FILE.name}' not found. Mod details will be limited.")
         return
+    if _try_sqlite_db_load():
+        return # Indexed lookups straight from the sidecar; nothing to parse.
+    # Sidecar missing or stale: serve this session from the JSON backends and
+    # rebuild the sidecar in the background for the next launch.
+    threading.Thread(target=_rebuild_sqlite_sidecar,
+                     args=(DB_JSON_FILE.stat().st_mtime_ns,), daemon=True).start()
+    if cysimdjson is not None and _try_lazy_db_load():
+        return # Details materialize on demand from the lazy document.
+    if ijson is not None and _try_stream_db_load():
+        return # Details materialize on demand from the raw leaf store.
     try:
-        with open(DB_JSON_FILE, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            if "mods" in data and isinstance(data["mods"], dict):
-                for package_id, steam_ids_dict in data["mods"].items():
-                    if isinstance(steam_ids_dict, dict):
-                        _GLOBAL_DB_PACKAGEID_TO_STEAMID.setdefault(package_id.lower(), [])
-                        for steam_id, details in steam_ids_dict.items():
-                            if steam_id.isdigit():
-                                _GLOBAL_DB_MOD_DETAILS[steam_id] = {
-                                    "package_id": package_id.lower(), # Store package_id normalized
-                                    "name": details.get("name", "Unknown Name"),
-                                    "versions": [v.strip() for v in details.get("versions", []) if isinstance(v, str)],
-                                    "authors": [a.strip() for a in details.get("authors", "").split(',') if a.strip()],
-                                    "published": details.get("published", False)
-                                }
-                                _GLOBAL_DB_PACKAGEID_TO_STEAMID[package_id.lower()].append(steam_id)
-    except (json.JSONDecodeError, IOError) as e:
+        with open(DB_JSON_FILE, 'rb') as f:
+            if orjson is not None:
+                # orjson accepts buffer objects: memory-map the file so the
+                # parser reads from the page cache instead of a full bytes copy.
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    data = orjson.loads(memoryview(mm))
+            else:
+                data = json.loads(f.read())
+            mods = data.get("mods")
+            if isinstance(mods, dict):
+                # Build the flat details map in one dict comprehension (a
+                # single C-level loop, no per-row statement dispatch). The
+                # packageId index is filled as a side effect of the same
+                # pass: list.append returns None, so `or True` keeps the
+                # filter clause truthy.
+                p2s = collections.defaultdict(list)
+                _GLOBAL_DB_MOD_DETAILS = {
+                    steam_id: {
+                        "package_id": pkg_l, # Store package_id normalized
+                        "name": details.get("name", "Unknown Name"),
+                        "versions": [v.strip() for v in details.get("versions", []) if isinstance(v, str)],
+                        "authors": [a for a in _CSV_SPLIT(details.get("authors", "").strip()) if a],
+                        "published": details.get("published", False)
+                    }
+                    for pkg_l, steam_ids_dict in ((_norm(p), s) for p, s in mods.items() if isinstance(s, dict))
+                    for steam_id, details in steam_ids_dict.items()
+                    if _SID_MATCH(steam_id) and (p2s[pkg_l].append(steam_id) or True)
+                }
+                _GLOBAL_DB_PACKAGEID_TO_STEAMID = dict(p2s)
+                pub_sid = _PUBLISHED_STEAMID_FOR_PKG; any_sid = _ANY_STEAMID_FOR_PKG
+                name_idx = _PKG_NAME_INDEX
+                for steam_id, det in _GLOBAL_DB_MOD_DETAILS.items():
+                    pkg_l = det["package_id"]
+                    if pkg_l not in any_sid:
+                        any_sid[pkg_l] = steam_id; name_idx[pkg_l] = det["name"]
+                    if det["published"] and pkg_l not in pub_sid:
+                        pub_sid[pkg_l] = steam_id; name_idx[pkg_l] = det["name"]
+    except (ValueError, IOError) as e:
         messagebox.showerror("DB Load Error", f"Error loading '{DB_JSON_FILE.name}': {e}\nPlease check its format.")
 _load_and_flatten_db_json() # Load DB on script start
+_build_prefix_index() # One pass over the loaded ids; serves the autofill below
 
 def get_mod_details_from_db(package_id: str) -> Optional[Dict[str, Any]]:
     """Fetches mod details by package_id from the global DB cache."""
-    # Find any SteamID associated with this packageId
-    steam_ids = _GLOBAL_DB_PACKAGEID_TO_STEAMID.get(package_id.lower())
+    package_id_l = _norm(package_id)
+    if _GLOBAL_DB_SQLITE_CONN is not None:
+        return _sqlite_lookup(package_id_l)
+    # Prioritize a published version if multiple SteamIDs exist for a packageId
+    steam_id = _PUBLISHED_STEAMID_FOR_PKG.get(package_id_l) or _ANY_STEAMID_FOR_PKG.get(package_id_l)
+    if steam_id is not None:
+        return _get_details_for_steam_id(steam_id, package_id_l)
+    # Lazy backend: the chosen-SteamID indexes are not populated, so scan
+    # this packageId's (usually short) list, materializing on demand.
+    steam_ids = _GLOBAL_DB_PACKAGEID_TO_STEAMID.get(package_id_l)
     if steam_ids:
-        # Prioritize a published version if multiple SteamIDs exist for a packageId
         for steam_id in steam_ids:
-            details = _GLOBAL_DB_MOD_DETAILS.get(steam_id)
+            details = _get_details_for_steam_id(steam_id, package_id_l)
             if details and details.get("published"):
                 return details
         # If no published version found, return details of the first one
-        return _GLOBAL_DB_MOD_DETAILS.get(steam_ids[0])
+        return _get_details_for_steam_id(steam_ids[0], package_id_l)
+    return None
+
+# Memoized wrapper for the keystroke-driven dialog autofill, which can look a
+# packageId up twice per key event. Misses (None results) are cached too, so
+# the common reverse-lookup miss costs one hash probe after the first time.
+_get_mod_details_cached = functools.lru_cache(maxsize=4096)(get_mod_details_from_db)
+
+def get_mod_name_from_db(package_id: str) -> Optional[str]:
+    """Display name for a packageId. One dict probe when the name index is
+    warm (eager and streaming loads prebuild it); on a cold backend (sqlite,
+    lazy) it falls back to the full details lookup and warms the index."""
+    package_id_l = _norm(package_id)
+    name = _PKG_NAME_INDEX.get(package_id_l)
+    if name is not None:
+        return name
+    details = _get_mod_details_cached(package_id_l)
+    if details:
+        name = details["name"]
+        _PKG_NAME_INDEX[package_id_l] = name
+        return name
     return None
 
 # --- Data Models (Mirroring C# structures) ---
+# slots=True dataclasses: no per-instance __dict__, which matters with one
+# object per rule entry across the whole catalog. to_dict stays hand-written —
+# it owns the omit-empty camelCase output the downstream C# reader expects,
+# which direct dataclass serialization (PascalCase fields, empty sections
+# included) would not produce.
+@dataclass(slots=True)
 class ModDependencyRule:
-    def __init__(self, name: Union[str, List[str]] = "", comment: Union[str, List[str]] = ""):
-        self.Name = [name] if isinstance(name, str) else name
-        self.Comment = [comment] if isinstance(comment, str) else comment
+    Name: Union[str, List[str]] = ""
+    Comment: Union[str, List[str]] = ""
+
+    def __post_init__(self):
+        if isinstance(self.Name, str): self.Name = [self.Name]
+        if isinstance(self.Comment, str): self.Comment = [self.Comment]
 
     def to_dict(self):
         return {"name": self.Name, "comment": self.Comment}
 
+@dataclass(slots=True)
 class ModIncompatibilityRule:
-    def __init__(self, hard_incompatibility: bool = False, comment: Union[str, List[str]] = "", name: Union[str, List[str]] = ""):
-        self.HardIncompatibility = hard_incompatibility
-        self.Comment = [comment] if isinstance(comment, str) else comment
-        self.Name = [name] if isinstance(name, str) else name
+    HardIncompatibility: bool = False
+    Comment: Union[str, List[str]] = ""
+    Name: Union[str, List[str]] = ""
+
+    def __post_init__(self):
+        if isinstance(self.Comment, str): self.Comment = [self.Comment]
+        if isinstance(self.Name, str): self.Name = [self.Name]
 
     def to_dict(self):
         return {"hardIncompatibility": self.HardIncompatibility, "comment": self.Comment, "name": self.Name}
 
+@dataclass(slots=True)
 class LoadBottomRule:
-    def __init__(self, value: bool = False, comment: Union[str, List[str]] = ""):
-        self.Value = value
-        self.Comment = [comment] if isinstance(comment, str) else comment
+    Value: bool = False
+    Comment: Union[str, List[str]] = ""
+
+    def __post_init__(self):
+        if isinstance(self.Comment, str): self.Comment = [self.Comment]
 
     def to_dict(self):
         return {"value": self.Value, "comment": self.Comment}
 
+@dataclass(slots=True)
 class ModRule:
-    def __init__(self):
-        self.LoadBefore: Dict[str, ModDependencyRule] = {}
-        self.LoadAfter: Dict[str, ModDependencyRule] = {}
-        self.LoadBottom: Optional[LoadBottomRule] = None
-        self.Incompatibilities: Dict[str, ModIncompatibilityRule] = {}
-        self.SupportedVersions: List[str] = []
+    LoadBefore: Dict[str, ModDependencyRule] = field(default_factory=dict)
+    LoadAfter: Dict[str, ModDependencyRule] = field(default_factory=dict)
+    LoadBottom: Optional[LoadBottomRule] = None
+    Incompatibilities: Dict[str, ModIncompatibilityRule] = field(default_factory=dict)
+    SupportedVersions: List[str] = field(default_factory=list)
 
     @staticmethod
     def from_dict(data: Dict[str, Any]):
         rule = ModRule()
         if "loadBefore" in data:
-            rule.LoadBefore = {k: ModDependencyRule(name=v.get("name", []), comment=v.get("comment", [])) for k, v in data["loadBefore"].items()}
+            rule.LoadBefore = {k: ModDependencyRule(Name=v.get("name", []), Comment=v.get("comment", [])) for k, v in data["loadBefore"].items()}
         if "loadAfter" in data:
-            rule.LoadAfter = {k: ModDependencyRule(name=v.get("name", []), comment=v.get("comment", [])) for k, v in data["loadAfter"].items()}
+            rule.LoadAfter = {k: ModDependencyRule(Name=v.get("name", []), Comment=v.get("comment", [])) for k, v in data["loadAfter"].items()}
         if "loadBottom" in data and data["loadBottom"] is not None:
-            rule.LoadBottom = LoadBottomRule(value=data["loadBottom"].get("value", False), comment=data["loadBottom"].get("comment", []))
+            rule.LoadBottom = LoadBottomRule(Value=data["loadBottom"].get("value", False), Comment=data["loadBottom"].get("comment", []))
         if "incompatibilities" in data:
-            rule.Incompatibilities = {k: ModIncompatibilityRule(hard_incompatibility=v.get("hardIncompatibility", False), comment=v.get("comment", []), name=v.get("name", [])) for k, v in data["incompatibilities"].items()}
+            rule.Incompatibilities = {k: ModIncompatibilityRule(HardIncompatibility=v.get("hardIncompatibility", False), Comment=v.get("comment", []), Name=v.get("name", [])) for k, v in data["incompatibilities"].items()}
         if "supportedVersions" in data and data["supportedVersions"] is not None:
             # Handle StringOrStringListConverter behavior
             versions = data["supportedVersions"]
@@ -133,21 +520,81 @@ class ModRule:
         if self.SupportedVersions: data["supportedVersions"] = self.SupportedVersions # Python handles list -> JSON array
         return data
 
+# Typed msgspec mirror of the rules.json schema. Decoding straight into these
+# C-backed structs fuses parse + validation + object construction in one pass;
+# ModRule.from_struct then reads plain attributes instead of dict.get chains.
+# Serialization stays on to_dict, which owns the omit-empty-sections output
+# format the downstream C# reader expects.
+if msgspec is not None:
+    class _RawDependencyRule(msgspec.Struct):
+        name: Union[str, List[str]] = msgspec.field(default_factory=list)
+        comment: Union[str, List[str]] = msgspec.field(default_factory=list)
+
+    class _RawLoadBottomRule(msgspec.Struct):
+        value: bool = False
+        comment: Union[str, List[str]] = msgspec.field(default_factory=list)
+
+    class _RawIncompatibilityRule(msgspec.Struct):
+        hardIncompatibility: bool = False
+        comment: Union[str, List[str]] = msgspec.field(default_factory=list)
+        name: Union[str, List[str]] = msgspec.field(default_factory=list)
+
+    class _RawModRule(msgspec.Struct):
+        loadBefore: Dict[str, _RawDependencyRule] = msgspec.field(default_factory=dict)
+        loadAfter: Dict[str, _RawDependencyRule] = msgspec.field(default_factory=dict)
+        loadBottom: Optional[_RawLoadBottomRule] = None
+        incompatibilities: Dict[str, _RawIncompatibilityRule] = msgspec.field(default_factory=dict)
+        supportedVersions: Union[str, List[str], None] = None
+
+    class _RawRulesFile(msgspec.Struct):
+        rules: Dict[str, _RawModRule] = msgspec.field(default_factory=dict)
+
+    _RULES_DECODER = msgspec.json.Decoder(_RawRulesFile)
+
+    def _mod_rule_from_struct(raw: _RawModRule) -> ModRule:
+        rule = ModRule()
+        rule.LoadBefore = {k: ModDependencyRule(Name=v.name, Comment=v.comment) for k, v in raw.loadBefore.items()}
+        rule.LoadAfter = {k: ModDependencyRule(Name=v.name, Comment=v.comment) for k, v in raw.loadAfter.items()}
+        if raw.loadBottom is not None:
+            rule.LoadBottom = LoadBottomRule(Value=raw.loadBottom.value, Comment=raw.loadBottom.comment)
+        rule.Incompatibilities = {k: ModIncompatibilityRule(HardIncompatibility=v.hardIncompatibility, Comment=v.comment, Name=v.name) for k, v in raw.incompatibilities.items()}
+        versions = raw.supportedVersions
+        rule.SupportedVersions = [versions] if isinstance(versions, str) else (versions or [])
+        return rule
+else:
+    _RULES_DECODER = None
+
 # --- Rules Repository (File Handling) ---
 class ModRulesRepository:
     def __init__(self, filepath: Path):
         self.filepath = filepath
+        # (st_mtime_ns, rules) of the last parse; a Load click re-reads the
+        # whole file otherwise, and rules.json only changes through save_rules.
+        self._cache: Optional[Tuple[int, Dict[str, ModRule]]] = None
+        # Reused across saves: holds the serialized payload so repeated Save
+        # clicks on a large catalog amortize the buffer allocation, and the
+        # memoryview write hands the kernel the bytes without another copy.
+        self._save_buf = bytearray()
 
     def get_all_rules(self) -> Dict[str, ModRule]:
         if not self.filepath.exists():
             return {}
         try:
-            with open(self.filepath, 'r', encoding='utf-8') as f:
-                raw_data = json.load(f)
-                rules_data = raw_data.get("rules", {})
-                # Normalize keys to lowercase when loading, similar to C#
-                return {k.lower(): ModRule.from_dict(v) for k, v in rules_data.items()}
-        except (json.JSONDecodeError, IOError) as e:
+            mtime_ns = self.filepath.stat().st_mtime_ns
+            if self._cache is not None and self._cache[0] == mtime_ns:
+                return self._cache[1]
+            with open(self.filepath, 'rb') as f:
+                if _RULES_DECODER is not None:
+                    # Normalize keys to lowercase when loading, similar to C#
+                    rules = {_norm(k): _mod_rule_from_struct(v) for k, v in _RULES_DECODER.decode(f.read()).rules.items()}
+                else:
+                    raw_data = orjson.loads(f.read()) if orjson is not None else json.loads(f.read())
+                    rules_data = raw_data.get("rules", {})
+                    # Normalize keys to lowercase when loading, similar to C#
+                    rules = {_norm(k): ModRule.from_dict(v) for k, v in rules_data.items()}
+                self._cache = (mtime_ns, rules)
+                return rules
+        except (ValueError, IOError) as e:
             messagebox.showerror("Rules Load Error", f"Error loading '{self.filepath.name}': {e}\nPlease check its format or delete it to start fresh.")
             return {}
 
@@ -155,61 +602,90 @@ class ModRulesRepository:
         try:
             # Convert ModRule objects to dictionaries for JSON serialization
             serializable_rules = {k: v.to_dict() for k, v in rules.items()}
-            # Add timestamp just like the C# example
-            output_data = {"timestamp": int(datetime.now().timestamp()), "rules": serializable_rules}
-            with open(self.filepath, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=4, ensure_ascii=False)
+            # Add timestamp just like the C# example. time_ns is one C call
+            # with no datetime object construction — and datetime was only
+            # ever imported under __main__, so this also fixes a NameError
+            # when the repository is used as a library.
+            output_data = {"timestamp": time.time_ns() // 1_000_000_000, "rules": serializable_rules}
+            if orjson is not None:
+                payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+            else:
+                payload = json.dumps(output_data, indent=2, ensure_ascii=False).encode('utf-8')
+            self._save_buf[:] = payload
+            del payload
+            # Write to a sibling temp file and swap it in atomically; a crash
+            # mid-write can no longer leave a truncated rules.json behind.
+            tmp_path = self.filepath.with_suffix('.json.tmp')
+            with open(tmp_path, 'wb') as f:
+                f.write(memoryview(self._save_buf))
+            os.replace(tmp_path, self.filepath)
+            self._cache = (self.filepath.stat().st_mtime_ns, dict(rules))
             messagebox.showinfo("Save Success", f"Rules saved to '{self.filepath.name}' successfully.")
         except Exception as e:
             messagebox.showerror("Save Error", f"Failed to save rules to '{self.filepath.name}': {e}")
 
-# --- Async Worker for Background Operations ---
-def run_async_worker(async_func, q: queue.Queue, *args):
+# --- Main Fetch Logic for Mod Rules ---
+def fetch_rule_worker(q: queue.Queue, notify, all_rules: Dict[str, ModRule], package_id: str):
+    """Runs in a plain worker thread: everything here is in-memory lookups,
+    so no event loop is involved. Queues one message and wakes the UI."""
     try:
-        if sys.platform == "win32": asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-        asyncio.run(async_func(q, *args))
-    except Exception as e:
-        q.put(("error_info", f"An unexpected error occurred: {e}"))
+        # Try to get details from db.json for display
+        mod_details = get_mod_details_from_db(package_id)
 
-# --- Main Fetch Logic for Mod Rules ---
-async def async_fetch_rule_worker(q: queue.Queue, package_id: str):
-    repo = ModRulesRepository(RULES_JSON_FILE)
-    all_rules = repo.get_all_rules()
-    
-    # Try to get details from db.json for display
-    mod_details = get_mod_details_from_db(package_id)
-
-    if not mod_details:
-        q.put(("failure_info", f"Package ID '{package_id}' not found in '{DB_JSON_FILE.name}'. Please ensure it's installed and run 'db_updater.py' first."))
-        return
+        if not mod_details:
+            q.put(("failure_info", f"Package ID '{package_id}' not found in '{DB_JSON_FILE.name}'. Please ensure it's installed and run 'db_updater.py' first."))
+            return
 
-    # Normalize packageId for lookup (similar to C# ModRulesService)
-    normalized_package_id = package_id.lower()
+        # Normalize packageId for lookup (similar to C# ModRulesService)
+        normalized_package_id = _norm(package_id)
 
-    if normalized_package_id in all_rules:
-        # Load existing rule
-        rule_data = all_rules[normalized_package_id].to_dict() # Convert back to dict for sending
-        q.put(("load_success", {"package_id": normalized_package_id, "rule": rule_data, "mod_details": mod_details, "is_new": False}))
-    else:
-        # Initialize new rule
-        q.put(("load_success", {"package_id": normalized_package_id, "rule": ModRule().to_dict(), "mod_details": mod_details, "is_new": True}))
+        if normalized_package_id in all_rules:
+            # Load existing rule
+            rule_data = all_rules[normalized_package_id].to_dict() # Convert back to dict for sending
+            q.put(("load_success", {"package_id": normalized_package_id, "rule": rule_data, "mod_details": mod_details, "is_new": False}))
+        else:
+            # Initialize new rule
+            q.put(("load_success", {"package_id": normalized_package_id, "rule": ModRule().to_dict(), "mod_details": mod_details, "is_new": True}))
+    except Exception as e:
+        q.put(("error_info", f"An unexpected error occurred: {e}"))
+    finally:
+        notify() # Wake the Tk side exactly once per fetch
 
 # --- Tkinter App ---
 class RulesManagerApp:
+    # Treeview column id shared by every single-column read; the display text
+    # stays "Package ID" via the heading configuration.
+    _COL_PKG_ID = "package_id"
+
     def __init__(self, root):
         self.root = root
         self.root.title("RimWorld Rules Manager")
         self.root.geometry("1000x700")
 
         self.repository = ModRulesRepository(RULES_JSON_FILE)
+        # Live working copy of the rules; saves mutate this in place and
+        # serialize once, instead of a read-modify-write of the whole file.
+        self.all_rules: Dict[str, ModRule] = self.repository.get_all_rules()
         self.current_package_id: Optional[str] = None
         self.current_mod_rule: Optional[ModRule] = None
         self.is_new_rule: bool = False
         self.queue = queue.Queue()
+        # Which rule list (if any) holds each lowercased packageId, mirroring
+        # the three treeviews. One dict probe answers both "duplicate in this
+        # list?" and "conflict with another list?" — and names the offender.
+        self._pkg_to_list: Dict[str, str] = {}
+        # list_type -> Treeview, filled as _setup_ui builds each list; avoids
+        # an f-string + getattr on every access.
+        self._trees: Dict[str, ttk.Treeview] = {}
+        # Bulk operations flip this on so the validator collects warnings
+        # instead of blocking on one modal popup per row.
+        self._suppress_warnings = False
+        self._collected_errors: List[Tuple[str, str]] = []
 
         self._setup_ui()
         self._reset_ui_state() # Initial UI state
-        self.process_queue() # Start listening for worker messages
+        # Workers fire a virtual event when results are queued; no idle polling.
+        self.root.bind('<<RuleReady>>', self.process_queue)
 
     def _setup_ui(self):
         main_frame = ttk.Frame(self.root, padding="10"); main_frame.pack(fill=tk.BOTH, expand=True)
@@ -275,13 +751,13 @@ class RulesManagerApp:
 
     def _setup_dependency_list_ui(self, parent_frame, list_type: str):
         # Treeview for dependencies
-        tree = ttk.Treeview(parent_frame, columns=("Package ID", "Display Name", "Comment"), show="headings")
-        tree.heading("Package ID", text="Package ID", anchor="w")
-        tree.heading("Display Name", text="Display Name", anchor="w")
-        tree.heading("Comment", text="Comment", anchor="w")
-        tree.column("Package ID", width=150, stretch=tk.NO)
-        tree.column("Display Name", width=200, stretch=tk.NO)
-        tree.column("Comment", width=300, stretch=tk.YES)
+        tree = ttk.Treeview(parent_frame, columns=(self._COL_PKG_ID, "display_name", "comment"), show="headings")
+        tree.heading(self._COL_PKG_ID, text="Package ID", anchor="w")
+        tree.heading("display_name", text="Display Name", anchor="w")
+        tree.heading("comment", text="Comment", anchor="w")
+        tree.column(self._COL_PKG_ID, width=150, stretch=tk.NO)
+        tree.column("display_name", width=200, stretch=tk.NO)
+        tree.column("comment", width=300, stretch=tk.YES)
         tree.pack(fill=tk.BOTH, expand=True)
         
         # Scrollbar for Treeview
@@ -290,7 +766,7 @@ class RulesManagerApp:
         tree.configure(yscrollcommand=vsb.set)
 
         # Store treeview reference
-        setattr(self, f"{list_type}_tree", tree)
+        self._trees[list_type] = tree
 
         # Buttons
         button_frame = ttk.Frame(parent_frame); button_frame.pack(fill=tk.X, pady=5)
@@ -300,15 +776,15 @@ class RulesManagerApp:
 
     def _setup_incompatibility_list_ui(self, parent_frame, list_type: str):
         # Treeview for incompatibilities
-        tree = ttk.Treeview(parent_frame, columns=("Package ID", "Display Name", "Hard Incomp.", "Comment"), show="headings")
-        tree.heading("Package ID", text="Package ID", anchor="w")
-        tree.heading("Display Name", text="Display Name", anchor="w")
-        tree.heading("Hard Incomp.", text="Hard Incomp.", anchor="w")
-        tree.heading("Comment", text="Comment", anchor="w")
-        tree.column("Package ID", width=150, stretch=tk.NO)
-        tree.column("Display Name", width=200, stretch=tk.NO)
-        tree.column("Hard Incomp.", width=80, stretch=tk.NO)
-        tree.column("Comment", width=300, stretch=tk.YES)
+        tree = ttk.Treeview(parent_frame, columns=(self._COL_PKG_ID, "display_name", "hard_incomp", "comment"), show="headings")
+        tree.heading(self._COL_PKG_ID, text="Package ID", anchor="w")
+        tree.heading("display_name", text="Display Name", anchor="w")
+        tree.heading("hard_incomp", text="Hard Incomp.", anchor="w")
+        tree.heading("comment", text="Comment", anchor="w")
+        tree.column(self._COL_PKG_ID, width=150, stretch=tk.NO)
+        tree.column("display_name", width=200, stretch=tk.NO)
+        tree.column("hard_incomp", width=80, stretch=tk.NO)
+        tree.column("comment", width=300, stretch=tk.YES)
         tree.pack(fill=tk.BOTH, expand=True)
 
         # Scrollbar for Treeview
@@ -317,7 +793,7 @@ class RulesManagerApp:
         tree.configure(yscrollcommand=vsb.set)
 
         # Store treeview reference
-        setattr(self, f"{list_type}_tree", tree)
+        self._trees[list_type] = tree
 
         # Buttons
         button_frame = ttk.Frame(parent_frame); button_frame.pack(fill=tk.X, pady=5)
@@ -335,14 +811,25 @@ class RulesManagerApp:
         self.package_id_entry.config(state='disabled') # Disable input while processing
         self.load_button.config(state='disabled')
 
+        # Refresh the working copy first; the mtime-cached repository makes
+        # this a no-op unless rules.json was edited externally.
+        self.all_rules = self.repository.get_all_rules()
+
         # Run fetch in a thread
-        threading.Thread(target=run_async_worker, args=(async_fetch_rule_worker, self.queue, package_id), daemon=True).start()
+        threading.Thread(target=fetch_rule_worker, args=(self.queue, self._notify_queue, self.all_rules, package_id), daemon=True).start()
 
-    def process_queue(self):
+    def _notify_queue(self):
+        """Thread-safe wake-up: schedules a <<RuleReady>> event on the Tk loop."""
+        try:
+            self.root.event_generate('<<RuleReady>>', when='tail')
+        except (tk.TclError, RuntimeError):
+            pass # Window torn down while a worker was finishing
+
+    def process_queue(self, event=None):
         try:
             while not self.queue.empty():
                 msg_type, data = self.queue.get_nowait()
-                
+
                 if msg_type == "load_success":
                     self.current_package_id = data["package_id"] # Ensure it's the normalized ID
                     self.current_mod_rule = ModRule.from_dict(data["rule"])
@@ -355,9 +842,8 @@ class RulesManagerApp:
                 elif msg_type == "error_info":
                     messagebox.showerror("Error", data)
                     self._reset_ui_state()
-            self.root.after(100, self.process_queue)
         except queue.Empty:
-            self.root.after(100, self.process_queue)
+            pass
         finally:
             # Re-enable input fields after processing
             if self.package_id_entry.cget('state') == 'disabled':
@@ -389,21 +875,58 @@ class RulesManagerApp:
             self.load_bottom_comment_text.delete("1.0", tk.END)
 
         # Load Before, Load After, Incompatibilities
-        self._populate_treeview(self.loadBefore_tree, rule.LoadBefore, is_incomp=False)
-        self._populate_treeview(self.loadAfter_tree, rule.LoadAfter, is_incomp=False)
-        self._populate_treeview(self.incompatibilities_tree, rule.Incompatibilities, is_incomp=True)
-
-    def _populate_treeview(self, tree, rules_dict, is_incomp: bool):
-        for item in tree.get_children(): tree.delete(item)
-        for pkg_id, rule_obj in rules_dict.items():
-            display_name = ", ".join(getattr(rule_obj, "Name", [])) if hasattr(rule_obj, "Name") else ""
-            comment = ", ".join(getattr(rule_obj, "Comment", [])) if hasattr(rule_obj, "Comment") else ""
-
-            if is_incomp:
-                hard_incomp = "Yes" if getattr(rule_obj, "HardIncompatibility", False) else "No"
-                tree.insert("", tk.END, values=(pkg_id, display_name, hard_incomp, comment))
-            else:
-                tree.insert("", tk.END, values=(pkg_id, display_name, comment))
+        self._populate_treeview("loadBefore", rule.LoadBefore, is_incomp=False)
+        self._populate_treeview("loadAfter", rule.LoadAfter, is_incomp=False)
+        self._populate_treeview("incompatibilities", rule.Incompatibilities, is_incomp=True)
+
+    def _populate_treeview(self, list_type: str, rules_dict, is_incomp: bool):
+        tree = self._trees[list_type]
+        owners = self._pkg_to_list
+        for pkg in [p for p, lt in owners.items() if lt == list_type]:
+            del owners[pkg]
+        with self._bulk_update(tree):
+            tree.delete(*tree.get_children())
+            for pkg_id, rule_obj in rules_dict.items():
+                owners[pkg_id] = list_type
+                display_name = ", ".join(getattr(rule_obj, "Name", [])) if hasattr(rule_obj, "Name") else ""
+                comment = ", ".join(getattr(rule_obj, "Comment", [])) if hasattr(rule_obj, "Comment") else ""
+
+                if is_incomp:
+                    hard_incomp = "Yes" if getattr(rule_obj, "HardIncompatibility", False) else "No"
+                    tree.insert("", tk.END, values=(pkg_id, display_name, hard_incomp, comment))
+                else:
+                    tree.insert("", tk.END, values=(pkg_id, display_name, comment))
+
+    @contextmanager
+    def _bulk_update(self, tree):
+        """Unmaps a treeview and suspends its selection handler while many
+        rows change, so Tk does one relayout at exit instead of one per row."""
+        manager = tree.winfo_manager()
+        if manager == 'pack':
+            info = tree.pack_info()
+            # pack_info() does not record packing order; without an anchor the
+            # tree would re-pack after its scrollbar. Anchor on the next
+            # sibling so the original order survives (grid_remove keeps the
+            # cell, so the grid branch needs no equivalent).
+            siblings = tree.master.pack_slaves()
+            idx = siblings.index(tree)
+            if idx + 1 < len(siblings):
+                info['before'] = siblings[idx + 1]
+            tree.pack_forget()
+        elif manager == 'grid':
+            info = tree.grid_info(); tree.grid_remove()
+        else:
+            info = None
+        select_script = tree.bind("<<TreeviewSelect>>")
+        if select_script: tree.unbind("<<TreeviewSelect>>")
+        try:
+            yield tree
+        finally:
+            if select_script: tree.bind("<<TreeviewSelect>>", select_script)
+            if manager == 'pack':
+                tree.pack(**info)
+            elif manager == 'grid':
+                tree.grid(**info)
 
     def _update_action_buttons(self):
         self.save_button.config(state="normal")
@@ -416,9 +939,9 @@ class RulesManagerApp:
         self.supported_versions_text.delete("1.0", tk.END)
         self.load_bottom_value_var.set(False)
         self.load_bottom_comment_text.delete("1.0", tk.END)
-        self.loadBefore_tree.delete(*self.loadBefore_tree.get_children())
-        self.loadAfter_tree.delete(*self.loadAfter_tree.get_children())
-        self.incompatibilities_tree.delete(*self.incompatibilities_tree.get_children())
+        for tree in self._trees.values():
+            tree.delete(*tree.get_children())
+        self._pkg_to_list.clear()
         self.current_package_id = None
         self.current_mod_rule = None
         self.is_new_rule = False
@@ -433,25 +956,24 @@ class RulesManagerApp:
             return
 
         # Collect data from UI back into self.current_mod_rule
-        self.current_mod_rule.SupportedVersions = [s.strip() for s in self.supported_versions_text.get("1.0", tk.END).strip().split(',') if s.strip()]
+        self.current_mod_rule.SupportedVersions = [s for s in _CSV_SPLIT(self.supported_versions_text.get("1.0", tk.END).strip()) if s]
 
         if self.load_bottom_value_var.get():
             self.current_mod_rule.LoadBottom = LoadBottomRule(
-                value=True,
-                comment=[s.strip() for s in self.load_bottom_comment_text.get("1.0", tk.END).strip().split(',') if s.strip()]
+                Value=True,
+                Comment=[s for s in _CSV_SPLIT(self.load_bottom_comment_text.get("1.0", tk.END).strip()) if s]
             )
         else:
             self.current_mod_rule.LoadBottom = None
 
         # Rebuild dependency/incompatibility dicts from treeviews
-        self.current_mod_rule.LoadBefore = self._get_rules_from_treeview(self.loadBefore_tree, is_incomp=False)
-        self.current_mod_rule.LoadAfter = self._get_rules_from_treeview(self.loadAfter_tree, is_incomp=False)
-        self.current_mod_rule.Incompatibilities = self._get_rules_from_treeview(self.incompatibilities_tree, is_incomp=True)
+        self.current_mod_rule.LoadBefore = self._get_rules_from_treeview(self._trees["loadBefore"], is_incomp=False)
+        self.current_mod_rule.LoadAfter = self._get_rules_from_treeview(self._trees["loadAfter"], is_incomp=False)
+        self.current_mod_rule.Incompatibilities = self._get_rules_from_treeview(self._trees["incompatibilities"], is_incomp=True)
 
-        all_rules = self.repository.get_all_rules() # Get latest from file
-        all_rules[self.current_package_id] = self.current_mod_rule # Update/add current rule
+        self.all_rules[self.current_package_id] = self.current_mod_rule # Update/add current rule
 
-        self.repository.save_rules(all_rules)
+        self.repository.save_rules(self.all_rules)
         self.is_new_rule = False # It's no longer new after saving
         self._update_action_buttons()
 
@@ -461,10 +983,9 @@ class RulesManagerApp:
             return
         
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete the rule for '{self.current_package_id}'?"):
-            all_rules = self.repository.get_all_rules()
-            if self.current_package_id in all_rules:
-                del all_rules[self.current_package_id]
-                self.repository.save_rules(all_rules)
+            if self.current_package_id in self.all_rules:
+                del self.all_rules[self.current_package_id]
+                self.repository.save_rules(self.all_rules)
                 messagebox.showinfo("Delete Success", f"Rule for '{self.current_package_id}' deleted.")
                 self._reset_ui_state()
 
@@ -472,30 +993,31 @@ class RulesManagerApp:
         rules = {}
         for item_id in tree.get_children():
             values = tree.item(item_id, "values")
-            pkg_id = values[0].lower() # Normalize package ID
+            pkg_id = _norm(values[0]) # Normalize package ID
             display_name = values[1]
             comment = values[2 if not is_incomp else 3] # Comment is at index 2 for dep, 3 for incomp
 
             if is_incomp:
                 hard_incomp = values[2] == "Yes"
-                rules[pkg_id] = ModIncompatibilityRule(hard_incompatibility=hard_incomp, name=[display_name], comment=[comment])
+                rules[pkg_id] = ModIncompatibilityRule(HardIncompatibility=hard_incomp, Name=[display_name], Comment=[comment])
             else:
-                rules[pkg_id] = ModDependencyRule(name=[display_name], comment=[comment])
+                rules[pkg_id] = ModDependencyRule(Name=[display_name], Comment=[comment])
         return rules
 
     # --- Rule Management Methods for Lists ---
     def _add_dependency_rule(self, list_type: str):
         dialog = DependencyRuleEditorDialog(self.root, "Add Dependency Rule")
-        result = dialog.show()
+        result = dialog.result # Dialog.__init__ blocked until close
         if result:
-            package_id = result["package_id"].lower()
+            package_id = _norm(result["package_id"])
             if not self._validate_dependency_conflict(package_id, list_type, is_edit=False): return
             
-            tree = getattr(self, f"{list_type}_tree")
+            tree = self._trees[list_type]
             tree.insert("", tk.END, values=(package_id, result["display_name"], result["comment"]))
+            self._pkg_to_list[package_id] = list_type
 
     def _edit_dependency_rule(self, list_type: str):
-        tree = getattr(self, f"{list_type}_tree")
+        tree = self._trees[list_type]
         selected_item = tree.focus()
         if not selected_item:
             messagebox.showwarning("Edit Error", "Please select a rule to edit.")
@@ -503,31 +1025,37 @@ class RulesManagerApp:
         
         current_values = tree.item(selected_item, "values")
         dialog = DependencyRuleEditorDialog(self.root, "Edit Dependency Rule", current_values[0], current_values[1], current_values[2])
-        result = dialog.show()
+        result = dialog.result # Dialog.__init__ blocked until close
         if result:
-            new_package_id = result["package_id"].lower()
-            if new_package_id != current_values[0].lower(): # Only validate if package ID changed
-                if not self._validate_dependency_conflict(new_package_id, list_type, is_edit=True, old_package_id=current_values[0].lower()): return
+            new_package_id = _norm(result["package_id"])
+            if new_package_id != current_values[0]: # Only validate if package ID changed
+                if not self._validate_dependency_conflict(new_package_id, list_type, is_edit=True, old_package_id=current_values[0]): return
             
             tree.item(selected_item, values=(new_package_id, result["display_name"], result["comment"]))
+            self._pkg_to_list.pop(current_values[0], None)
+            self._pkg_to_list[new_package_id] = list_type
 
     def _remove_dependency_rule(self, list_type: str):
-        tree = getattr(self, f"{list_type}_tree")
+        tree = self._trees[list_type]
         selected_item = tree.focus()
-        if selected_item: tree.delete(selected_item)
+        if selected_item:
+            # tree.set fetches the one column; item(...)"values" marshals all of them
+            self._pkg_to_list.pop(tree.set(selected_item, self._COL_PKG_ID), None)
+            tree.delete(selected_item)
 
     def _add_incompatibility_rule(self, list_type: str):
         dialog = IncompatibilityRuleEditorDialog(self.root, "Add Incompatibility Rule")
-        result = dialog.show()
+        result = dialog.result # Dialog.__init__ blocked until close
         if result:
-            package_id = result["package_id"].lower()
+            package_id = _norm(result["package_id"])
             if not self._validate_dependency_conflict(package_id, list_type, is_edit=False): return
             
-            tree = getattr(self, f"{list_type}_tree")
+            tree = self._trees[list_type]
             tree.insert("", tk.END, values=(package_id, result["display_name"], "Yes" if result["hard_incompatibility"] else "No", result["comment"]))
+            self._pkg_to_list[package_id] = list_type
 
     def _edit_incompatibility_rule(self, list_type: str):
-        tree = getattr(self, f"{list_type}_tree")
+        tree = self._trees[list_type]
         selected_item = tree.focus()
         if not selected_item:
             messagebox.showwarning("Edit Error", "Please select a rule to edit.")
@@ -535,18 +1063,22 @@ class RulesManagerApp:
         
         current_values = tree.item(selected_item, "values")
         dialog = IncompatibilityRuleEditorDialog(self.root, "Edit Incompatibility Rule", current_values[0], current_values[1], current_values[3], current_values[2]=="Yes") # Package ID, Name, Comment, Hard Incomp.
-        result = dialog.show()
+        result = dialog.result # Dialog.__init__ blocked until close
         if result:
-            new_package_id = result["package_id"].lower()
-            if new_package_id != current_values[0].lower(): # Only validate if package ID changed
-                if not self._validate_dependency_conflict(new_package_id, list_type, is_edit=True, old_package_id=current_values[0].lower()): return
+            new_package_id = _norm(result["package_id"])
+            if new_package_id != current_values[0]: # Only validate if package ID changed
+                if not self._validate_dependency_conflict(new_package_id, list_type, is_edit=True, old_package_id=current_values[0]): return
             
             tree.item(selected_item, values=(new_package_id, result["display_name"], "Yes" if result["hard_incompatibility"] else "No", result["comment"]))
+            self._pkg_to_list.pop(current_values[0], None)
+            self._pkg_to_list[new_package_id] = list_type
 
     def _remove_incompatibility_rule(self, list_type: str):
-        tree = getattr(self, f"{list_type}_tree")
+        tree = self._trees[list_type]
         selected_item = tree.focus()
-        if selected_item: tree.delete(selected_item)
+        if selected_item:
+            self._pkg_to_list.pop(tree.set(selected_item, self._COL_PKG_ID), None)
+            tree.delete(selected_item)
 
     def _validate_dependency_conflict(self, package_id: str, current_list_type: str, is_edit: bool, old_package_id: Optional[str] = None) -> bool:
         """
@@ -556,163 +1088,236 @@ class RulesManagerApp:
         mod_details = get_mod_details_from_db(package_id)
         display_name = mod_details.get("name", package_id) if mod_details else package_id
 
-        # Check for existence in current list first (duplicate within same list)
-        current_tree = getattr(self, f"{current_list_type}_tree")
-        for item_id in current_tree.get_children():
-            existing_pkg_id = current_tree.item(item_id, "values")[0].lower()
-            if existing_pkg_id == package_id and not (is_edit and package_id == old_package_id):
-                messagebox.showwarning("Duplicate Entry", f"Package ID '{display_name}' already exists in the current list.")
+        owner = self._pkg_to_list.get(package_id)
+        if owner is not None:
+            if owner == current_list_type:
+                # Duplicate within the same list
+                if not (is_edit and package_id == old_package_id):
+                    self._warn("Duplicate Entry", f"Package ID '{display_name}' already exists in the current list.")
+                    return False
+            else:
+                self._warn("Rule Conflict", f"Package ID '{display_name}' already exists in the '{owner}' list. A package ID cannot be in multiple rule lists for this mod.")
                 return False
 
-        # Check other lists
-        all_list_types = ["loadBefore", "loadAfter", "incompatibilities"]
-        for list_type in all_list_types:
-            if list_type == current_list_type: continue # Skip current list
-            
-            other_tree = getattr(self, f"{list_type}_tree")
-            for item_id in other_tree.get_children():
-                existing_pkg_id = other_tree.item(item_id, "values")[0].lower()
-                if existing_pkg_id == package_id:
-                    messagebox.showwarning("Rule Conflict", f"Package ID '{display_name}' already exists in the '{list_type}' list. A package ID cannot be in multiple rule lists for this mod.")
-                    return False
-        
         return True
 
+    def _warn(self, title: str, message: str):
+        if self._suppress_warnings:
+            self._collected_errors.append((title, message))
+        else:
+            messagebox.showwarning(title, message)
+
+    @contextmanager
+    def _bulk_validation(self):
+        """Collects validation warnings instead of popping a modal per row;
+        yields the (title, message) list for one aggregated report at the end."""
+        self._suppress_warnings = True
+        self._collected_errors = []
+        try:
+            yield self._collected_errors
+        finally:
+            self._suppress_warnings = False
+
 # --- Pop-up Dialogs for Dependency/Incompatibility Rules ---
-class DependencyRuleEditorDialog(simpledialog.Dialog):
+class _RuleDialogMixin:
+    """Machinery shared by both rule editor dialogs: the debounced display-
+    name autofill and the common apply validation. One copy means every
+    optimization to this hot path lands in both dialogs instead of drifting
+    between duplicated bodies."""
+
+    # (label, attribute, bind debounced autofill) — body() renders these via
+    # _build_rows instead of repeating the Label/Entry/grid block per field.
+    _ROWS = (
+        ("Package ID:", "package_id", True),
+        ("Display Name:", "display_name", False),
+        ("Comment (optional):", "comment", False),
+    )
+
+    def _add_row(self, master, label: str, initial: str, row: int) -> Tuple[ttk.Entry, tk.StringVar]:
+        ttk.Label(master, text=label).grid(row=row, column=0, sticky="w", pady=5)
+        var = tk.StringVar(master, value=initial)
+        entry = ttk.Entry(master, textvariable=var)
+        entry.grid(row=row, column=1, sticky="ew", pady=5, padx=5)
+        return entry, var
+
+    def _build_rows(self, master, start_row: int = 0) -> int:
+        """Lays out the class's _ROWS starting at start_row; returns the next
+        free grid row."""
+        self._rows_master = master # The error label grids itself here on demand
+        for offset, (label, attr, bind_autofill) in enumerate(self._ROWS):
+            entry, var = self._add_row(master, label, getattr(self, attr), start_row + offset)
+            if bind_autofill:
+                # A write trace fires exactly once per value change — keystroke,
+                # paste, or cut alike — unlike the old <KeyRelease> bind, which
+                # missed mouse paste and fired for non-editing keys.
+                var.trace_add("write", self._on_package_id_write)
+            elif attr == "display_name":
+                entry.bind("<Key>", self._on_display_name_edit) # Manual typing takes ownership
+            setattr(self, f"{attr}_entry", entry)
+            setattr(self, f"{attr}_var", var)
+        return start_row + len(self._ROWS)
+
+    def _on_package_id_write(self, *args):
+        self._clear_error() # Editing the id retracts its validation message
+        self._schedule_autofill()
+
+    def _set_error(self, message: str):
+        """Shows a validation message inline under the fields. Unlike the old
+        modal messagebox this keeps focus in the dialog and costs nothing in
+        the common valid case (the label is created on first failure)."""
+        if self._error_label is None:
+            row = self._rows_master.grid_size()[1] # Below whatever body() built
+            self._error_label = ttk.Label(self._rows_master, foreground="red")
+            self._error_label.grid(row=row, column=0, columnspan=2, sticky="w", pady=(2, 0))
+        self._error_label.config(text=message)
+
+    def _clear_error(self):
+        if self._error_label is not None:
+            self._error_label.config(text="")
+
+    def _on_display_name_edit(self, event=None):
+        """Any manual keystroke transfers ownership of Display Name to the user."""
+        self._display_name_autofilled = False
+
+    def _schedule_autofill(self, event=None):
+        """Coalesces a burst of keystrokes into one DB lookup ~150ms after the last."""
+        if self._autofill_after_id is not None:
+            self.package_id_entry.after_cancel(self._autofill_after_id)
+        self._autofill_after_id = self.package_id_entry.after(150, self._run_autofill)
+
+    def _run_autofill(self):
+        self._autofill_after_id = None
+        self._update_display_name_from_db()
+
+    def _cancel_autofill(self):
+        if self._autofill_after_id is not None:
+            try:
+                self.package_id_entry.after_cancel(self._autofill_after_id)
+            except tk.TclError:
+                pass
+            self._autofill_after_id = None
+
+    def destroy(self):
+        self._cancel_autofill() # No callbacks on a dead widget
+        super().destroy()
+
+    def _update_display_name_from_db(self, event=None):
+        """Attempts to auto-fill Display Name based on Package ID from db.json."""
+        pkg_id = _norm(self.package_id_var.get())
+        if pkg_id == self._last_pkg_id:
+            return # Non-editing key (arrows, modifiers) or no net change
+        self._last_pkg_id = pkg_id
+        if not _is_valid_pkg_id(pkg_id):
+            return # Cannot be a known id; skip the DB entirely
+        if pkg_id:
+            target = pkg_id
+            if _PKG_ID_SORTED:
+                has_match, sole_id = _pkg_id_prefix_state(pkg_id)
+                if not has_match:
+                    # Nothing in the DB starts with this input: skip the
+                    # lookup and retire any stale autofill text right away.
+                    if self._display_name_autofilled:
+                        self.display_name_entry.delete(0, tk.END)
+                        self._display_name_autofilled = False
+                    return
+                if sole_id is not None:
+                    target = sole_id # Unambiguous prefix: suggest its name early
+            mod_name = get_mod_name_from_db(target)
+            if mod_name is not None:
+                # Only autofill if the field is empty, still holds our previous
+                # autofill, or matches the package_id — never overwrite a name
+                # the user typed themselves.
+                current_display_name = self.display_name_var.get().strip()
+                if not current_display_name or self._display_name_autofilled or current_display_name.lower() == pkg_id:
+                    self.display_name_entry.delete(0, tk.END)
+                    self.display_name_entry.insert(0, mod_name)
+                    self._display_name_autofilled = True
+            elif self._display_name_autofilled:
+                # The id no longer matches anything; our stale autofill text
+                # goes with it. The flag replaces the old reverse name->id DB
+                # probe that ran on every miss.
+                self.display_name_entry.delete(0, tk.END)
+                self._display_name_autofilled = False
+
+    def validate(self) -> bool:
+        """simpledialog hook: a failed check shows the inline error and keeps
+        the dialog open, so apply() only ever sees valid input."""
+        pkg_id = _norm(self.package_id_var.get())
+        if not pkg_id:
+            self._set_error("Package ID cannot be empty.")
+            return False
+        # Never hard-fail an id the DB actually knows: the probe backstops the
+        # fast-reject so a catalogued id can always be submitted.
+        if not _is_valid_pkg_id(pkg_id) and get_mod_name_from_db(pkg_id) is None:
+            self._set_error("Package ID contains control characters.")
+            return False
+        return True
+
+    def _base_apply(self) -> Dict[str, Any]:
+        """Common apply body; runs after validate() has passed."""
+        self._cancel_autofill() # Don't let a pending lookup race the close
+        # Canonicalize here so every downstream consumer (trees, sets, rules)
+        # stores and compares the interned canonical form without re-folding.
+        self.package_id = _norm(self.package_id_var.get())
+        self.display_name = self.display_name_var.get().strip()
+        self.comment = self.comment_var.get().strip()
+        return {"package_id": self.package_id, "display_name": self.display_name, "comment": self.comment}
+
+class DependencyRuleEditorDialog(_RuleDialogMixin, simpledialog.Dialog):
     def __init__(self, parent, title: str, package_id="", display_name="", comment=""):
         self.package_id = package_id
         self.display_name = display_name
         self.comment = comment
+        self._autofill_after_id = None # Pending debounced autofill callback
+        self._last_pkg_id = None # Last id the autofill actually processed
+        self._display_name_autofilled = False # True while the DB owns Display Name
+        self._error_label = None # Created on first validation failure
+        self.result = None # Stays None on cancel; apply() overwrites on OK
         super().__init__(parent, title)
 
     def body(self, master):
-        ttk.Label(master, text="Package ID:").grid(row=0, column=0, sticky="w", pady=5)
-        self.package_id_entry = ttk.Entry(master)
-        self.package_id_entry.grid(row=0, column=1, sticky="ew", pady=5, padx=5)
-        self.package_id_entry.insert(0, self.package_id)
-        self.package_id_entry.bind("<KeyRelease>", self._update_display_name_from_db) # Bind for auto-fill
-
-        ttk.Label(master, text="Display Name:").grid(row=1, column=0, sticky="w", pady=5)
-        self.display_name_entry = ttk.Entry(master)
-        self.display_name_entry.grid(row=1, column=1, sticky="ew", pady=5, padx=5)
-        self.display_name_entry.insert(0, self.display_name)
-        
-        ttk.Label(master, text="Comment (optional):").grid(row=2, column=0, sticky="w", pady=5)
-        self.comment_entry = ttk.Entry(master)
-        self.comment_entry.grid(row=2, column=1, sticky="ew", pady=5, padx=5)
-        self.comment_entry.insert(0, self.comment)
-        
+        self._build_rows(master)
         return self.package_id_entry # Initial focus
 
-    def _update_display_name_from_db(self, event=None):
-        """Attempts to auto-fill Display Name based on Package ID from db.json."""
-        pkg_id = self.package_id_entry.get().strip()
-        if pkg_id:
-            mod_details = get_mod_details_from_db(pkg_id.lower())
-            if mod_details:
-                # Only autofill if the display name field is empty or matches the package_id
-                # This prevents overwriting user's manually entered display name
-                current_display_name = self.display_name_entry.get().strip()
-                if not current_display_name or current_display_name.lower() == pkg_id.lower():
-                    self.display_name_entry.delete(0, tk.END)
-                    self.display_name_entry.insert(0, mod_details["name"])
-            else:
-                # If mod details not found, and display name was autofilled, clear it
-                current_display_name = self.display_name_entry.get().strip()
-                mod_details_by_current_name = get_mod_details_from_db(current_display_name.lower()) # Check if current text is a valid pkg_id
-                if mod_details_by_current_name and mod_details_by_current_name.get("name") == current_display_name:
-                    self.display_name_entry.delete(0, tk.END) # Clear if it was an autofill for a now-invalid ID
-
     def apply(self):
-        self.package_id = self.package_id_entry.get().strip()
-        self.display_name = self.display_name_entry.get().strip()
-        self.comment = self.comment_entry.get().strip()
-        
-        if not self.package_id:
-            messagebox.showwarning("Validation", "Package ID cannot be empty.")
-            self.result = None # Prevent dialog from closing
-            return
-        self.result = {"package_id": self.package_id, "display_name": self.display_name, "comment": self.comment}
+        self.result = self._base_apply()
 
-    def show(self):
-        self.result = None
-        self.parent.wait_window(self)
-        return self.result
-
-class IncompatibilityRuleEditorDialog(simpledialog.Dialog): # DO NOT inherit from DependencyRuleEditorDialog.body() for layout
+class IncompatibilityRuleEditorDialog(_RuleDialogMixin, simpledialog.Dialog): # Distinct body(): the checkbox sits between the shared rows
     def __init__(self, parent, title: str, package_id="", display_name="", comment="", hard_incompatibility=False):
         self.package_id = package_id
         self.display_name = display_name
         self.comment = comment
         self.hard_incompatibility = hard_incompatibility
+        self._autofill_after_id = None # Pending debounced autofill callback
+        self._last_pkg_id = None # Last id the autofill actually processed
+        self._display_name_autofilled = False # True while the DB owns Display Name
+        self._error_label = None # Created on first validation failure
+        self.result = None # Stays None on cancel; apply() overwrites on OK
         super().__init__(parent, title)
 
-    def body(self, master):
-        # Explicitly lay out all widgets for precise control
-        row_counter = 0
-        
-        ttk.Label(master, text="Package ID:").grid(row=row_counter, column=0, sticky="w", pady=5)
-        self.package_id_entry = ttk.Entry(master)
-        self.package_id_entry.grid(row=row_counter, column=1, sticky="ew", pady=5, padx=5)
-        self.package_id_entry.insert(0, self.package_id)
-        self.package_id_entry.bind("<KeyRelease>", self._update_display_name_from_db) # Bind for auto-fill
-        row_counter += 1
+    # The comment row is laid out manually so the checkbox keeps its slot
+    # between Display Name and Comment.
+    _ROWS = _RuleDialogMixin._ROWS[:2]
 
-        ttk.Label(master, text="Display Name:").grid(row=row_counter, column=0, sticky="w", pady=5)
-        self.display_name_entry = ttk.Entry(master)
-        self.display_name_entry.grid(row=row_counter, column=1, sticky="ew", pady=5, padx=5)
-        self.display_name_entry.insert(0, self.display_name)
-        row_counter += 1
+    def body(self, master):
+        row_counter = self._build_rows(master)
 
         # Hard Incompatibility checkbox
         self.hard_incompatibility_var = tk.BooleanVar(value=self.hard_incompatibility)
         ttk.Checkbutton(master, text="Hard Incompatibility", variable=self.hard_incompatibility_var).grid(row=row_counter, columnspan=2, sticky="w", pady=5)
         row_counter += 1
-        
-        ttk.Label(master, text="Comment (optional):").grid(row=row_counter, column=0, sticky="w", pady=5)
-        self.comment_entry = ttk.Entry(master)
-        self.comment_entry.grid(row=row_counter, column=1, sticky="ew", pady=5, padx=5)
-        self.comment_entry.insert(0, self.comment)
-        row_counter += 1
-        
-        return self.package_id_entry # Initial focus
 
-    def _update_display_name_from_db(self, event=None):
-        """Attempts to auto-fill Display Name based on Package ID from db.json."""
-        pkg_id = self.package_id_entry.get().strip()
-        if pkg_id:
-            mod_details = get_mod_details_from_db(pkg_id.lower())
-            if mod_details:
-                current_display_name = self.display_name_entry.get().strip()
-                if not current_display_name or current_display_name.lower() == pkg_id.lower():
-                    self.display_name_entry.delete(0, tk.END)
-                    self.display_name_entry.insert(0, mod_details["name"])
-            else:
-                current_display_name = self.display_name_entry.get().strip()
-                mod_details_by_current_name = get_mod_details_from_db(current_display_name.lower())
-                if mod_details_by_current_name and mod_details_by_current_name.get("name") == current_display_name:
-                    self.display_name_entry.delete(0, tk.END)
+        self.comment_entry, self.comment_var = self._add_row(master, "Comment (optional):", self.comment, row_counter)
 
-    def apply(self):
-        self.package_id = self.package_id_entry.get().strip()
-        self.display_name = self.display_name_entry.get().strip()
-        self.comment = self.comment_entry.get().strip()
-        
-        if not self.package_id:
-            messagebox.showwarning("Validation", "Package ID cannot be empty.")
-            self.result = None # Prevent dialog from closing
-            return
-        self.result = {"package_id": self.package_id, "display_name": self.display_name, "comment": self.comment, "hard_incompatibility": self.hard_incompatibility_var.get()}
+        return self.package_id_entry # Initial focus
 
-    def show(self):
-        self.result = None
-        self.parent.wait_window(self)
-        return self.result
+    def apply(self):
+        result = self._base_apply()
+        result["hard_incompatibility"] = self.hard_incompatibility_var.get()
+        self.result = result
 
 # --- Main execution ---
 if __name__ == "__main__":
-    from datetime import datetime # Import here for timestamp
     app_root = tk.Tk()
     app = RulesManagerApp(app_root)
     app_root.mainloop()
\ No newline at end of file